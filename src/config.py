@@ -1,11 +1,72 @@
+import copy
+import json
 import os
 from pathlib import Path
-import shutil
-import yaml
+import stat
+from functools import lru_cache
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+
+@lru_cache(maxsize=None)
+def _yaml():
+    """延迟导入 PyYAML，返回 (yaml, Loader, Dumper)。
+
+    只有真正解析/保存 YAML 时才导入；命中 JSON 旁路缓存的启动（及文件未变时的重新加载）完全不加载 PyYAML。
+    优先使用 libyaml 的 C 实现（扫描/解析在 C 里跑），未编译 libyaml 时回退纯 Python 版；两者行为一致。
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader, CSafeDumper as dumper
+    except ImportError:
+        from yaml import SafeLoader as loader, SafeDumper as dumper
+    return yaml, loader, dumper
+
+
+def _is_file(path: Path) -> bool:
+    """一次 stat 判断是否为普通文件（代替 exists() + is_file() 两次 stat）"""
+    try:
+        return stat.S_ISREG(path.stat().st_mode)
+    except OSError:
+        return False
+
+
+# get_nested 的缓存哨兵：区分“路径不存在”与“值为 None”
+_MISSING = object()
+
+
+@lru_cache(maxsize=512)
+def _split_path(path: str) -> tuple:
+    """'a.b.c' → ('a', 'b', 'c')，同一路径只拆一次"""
+    return tuple(path.split('.'))
+
 
 class Config:
+    """config.yaml 配置读取与保存。
+
+    约定：各属性（web_port、api_key 等）与 get_nested 的结果在加载/save_config() 时解析并缓存。
+    直接原地修改 self.config[...] 后，必须调用 save_config()（它会作废缓存并重新解析），
+    否则属性仍返回修改前的值；get()/self.config 本身读的是实时字典，不受影响。
+    """
+
+    # 属性名 → (配置键元组, _defaults 中的默认值键)。属性在 load/save 后统一解析进 _resolved，访问时只是一次字典查找；
+    # 路径直接写成元组，解析时不必再拆分字符串
+    _PROPERTY_PATHS = (
+        ('allowed_origins', ('WebSecurity', 'ALLOWED_ORIGINS'), 'ALLOWED_ORIGINS'),
+        ('api_key', ('WebSecurity', 'API_KEY'), 'API_KEY'),
+        ('rate_limit', ('WebSecurity', 'RATE_LIMIT'), 'RATE_LIMIT'),
+        ('rate_limit_storage', ('WebSecurity', 'RATE_LIMIT_STORAGE'), 'RATE_LIMIT_STORAGE'),
+        ('ip_whitelist', ('WebSecurity', 'IP_WHITELIST'), 'IP_WHITELIST'),
+        ('public_endpoints', ('WebSecurity', 'PUBLIC_ENDPOINTS'), 'PUBLIC_ENDPOINTS'),
+        ('qr_password', ('QR_PASSWORD',), 'QR_PASSWORD'),
+        ('web_host', ('web_host',), 'web_host'),
+        ('web_port', ('web_port',), 'web_port'),
+        ('debug', ('debug',), 'debug'),
+        ('web_threads', ('web_threads',), 'web_threads'),
+        ('web_connection_limit', ('web_connection_limit',), 'web_connection_limit'),
+        ('cors_origins', ('cors_origins',), 'cors_origins'),
+    )
+
     def __init__(self, config_path: str | None = None):
         # 1. 确定基准路径（config.py所在目录，即src目录）
         self.current_dir = Path(__file__).resolve().parent  # src目录（同级目录）
@@ -20,13 +81,13 @@ class Config:
             self.config_path = self.parent_dir / "config.yaml"
 
         # 3. 检查目标配置文件是否存在，不存在则尝试从 config.sample.yaml 模板拷贝
-        if not self.config_path.exists() or not self.config_path.is_file():
+        if not _is_file(self.config_path):
             # 唯一模板为 config.sample.yaml：优先项目根/容器 /app（parent_dir），其次 config.py 同级目录
             template_candidates = [
                 self.parent_dir / "config.sample.yaml",
                 self.current_dir / "config.sample.yaml",
             ]
-            template_path = next((p for p in template_candidates if p.exists() and p.is_file()), None)
+            template_path = next((p for p in template_candidates if _is_file(p)), None)
 
             # 检查模板是否存在
             if template_path is not None:
@@ -34,8 +95,16 @@ class Config:
                     # 确保父目录存在（Docker环境可能需要创建）
                     self.parent_dir.mkdir(parents=True, exist_ok=True)
 
-                    # 拷贝模板到父目录
-                    shutil.copy2(template_path, self.config_path)  # 保留文件元数据
+                    # 模板只有几 KB：读一次、写临时文件、原子改名到位。目标是新文件，无需 copy2 逐项复制元数据；
+                    # 改名保证其他进程要么看不到配置文件，要么看到完整内容
+                    tmp_path = self.config_path.with_name(self.config_path.name + '.tmp')
+                    try:
+                        tmp_path.write_bytes(template_path.read_bytes())
+                        os.replace(tmp_path, self.config_path)
+                    except BaseException:
+                        # 写入或改名中途失败：清掉残留的半截临时文件再抛出
+                        tmp_path.unlink(missing_ok=True)
+                        raise
                     logging.info(f"未找到配置文件，已从模板拷贝: {template_path} -> {self.config_path}")
                 except Exception as e:
                     logging.error(f"拷贝配置模板失败（可能是权限问题）: {str(e)}")
@@ -44,9 +113,9 @@ class Config:
                 logging.warning(f"未找到配置模板 config.sample.yaml（已查找: {', '.join(str(p) for p in template_candidates)}）")
         
         # 4. 若上述步骤仍未找到配置文件，检查当前工作目录（兼容原有备用逻辑）
-        if not self.config_path.exists() or not self.config_path.is_file():
+        if not _is_file(self.config_path):
             alt_path = Path.cwd() / self.config_path.name
-            if alt_path.exists() and alt_path.is_file():
+            if _is_file(alt_path):
                 self.config_path = alt_path
                 logging.info(f"使用当前工作目录的配置文件: {self.config_path}")
             else:
@@ -55,12 +124,19 @@ class Config:
 
         logging.info(f"使用配置文件: {self.config_path} (cwd={Path.cwd()})")
         self.config: Dict[str, Any] = {}
-        self.load_config()
+        self._nested_cache: Dict[tuple, Any] = {}  # 键元组 → 值（或 _MISSING），load/save 时清空
+        self._resolved: Dict[str, Any] = {}  # 各属性的最终取值，load/save 后统一解析一次
+        # 最近一次读/写磁盘时的 (mtime_ns, size, 配置副本)：重新 load 时文件未变可跳过解析，
+        # save 时据此判断内存配置与磁盘是否一致
+        self._disk_state: Optional[tuple] = None
         # 定义所有参数的默认值（与用户提供的默认值保持一致）
         self._defaults = {
             'web_host': '0.0.0.0',
             'web_port': '5151',
             'debug': False,
+            # waitress 工作线程数：上游请求以 I/O 等待为主，按 CPU 核数的 4 倍给，至少 8 个
+            'web_threads': max(8, (os.cpu_count() or 1) * 4),
+            'web_connection_limit': 1024,  # waitress 同时保持的连接上限（含 keep-alive 空闲连接）
             'QR_PASSWORD': '1234',
             'cors_origins': '*',
             'API_KEY': '9527',  # 替换为你的API密钥
@@ -70,19 +146,97 @@ class Config:
             'PUBLIC_ENDPOINTS': ["/health", "/"],  # 公开接口（无需保护）
             'ALLOWED_ORIGINS': 'http://localhost:5151',
         }
-        
+        self.load_config()
+
     def load_config(self) -> None:
         """加载配置文件"""
+        self._nested_cache.clear()
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f) or {}
-            logging.info(f"配置文件加载成功: {self.config_path}")
+            st = self.config_path.stat()
+            cached = self._disk_state
+            if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+                # 调用方会原地修改 self.config（如写入 cookie），记录里存的是副本，取出时也给副本
+                self.config = copy.deepcopy(cached[2])
+                logging.info(f"配置文件加载成功（文件未变，复用已解析结果）: {self.config_path}")
+            elif (sidecar := self._load_sidecar(st)) is not None:
+                self.config = sidecar
+                self._remember_parsed(st)
+                logging.info(f"配置文件加载成功（JSON 缓存）: {self.config_path}")
+            else:
+                # 整块读入字节交给 YAML 解析器自行解码（libyaml 在 C 里做），省去文本模式的逐行解码
+                yaml, loader, _ = _yaml()
+                self.config = yaml.load(self.config_path.read_bytes(), Loader=loader) or {}
+                self._remember_parsed(st)
+                self._write_sidecar(st)
+                logging.info(f"配置文件加载成功: {self.config_path}")
         except FileNotFoundError:
             logging.error(f"配置文件未找到: {self.config_path}")
             raise
         except Exception as e:
             logging.error(f"配置文件加载失败: {str(e)}")
             raise
+        self._resolve_properties()
+
+    def _resolve_properties(self) -> None:
+        """按 _PROPERTY_PATHS 一次性解析所有属性的取值（配置值优先，缺省用 _defaults）"""
+        self._resolved = {
+            name: self.get_nested_tuple(keys, self._defaults[default_key])
+            for name, keys, default_key in self._PROPERTY_PATHS
+        }
+
+    def _remember_parsed(self, st: os.stat_result) -> None:
+        """记录与文件当前 stat 对应的配置内容（存副本）"""
+        self._disk_state = (st.st_mtime_ns, st.st_size, copy.deepcopy(self.config))
+
+    @property
+    def _sidecar_path(self) -> Path:
+        """JSON 旁路缓存路径（config.yaml → config.yaml.json）"""
+        return self.config_path.with_name(self.config_path.name + '.json')
+
+    def _load_sidecar(self, st: os.stat_result) -> Optional[Dict[str, Any]]:
+        """读取 JSON 旁路缓存。仅当其中记录的 YAML stat 与当前一致时有效，否则返回 None。
+
+        YAML 仍是唯一的配置来源；旁路缓存只是冷启动时省去 YAML 解析（同样的数据 JSON 解析快一个数量级）。
+        """
+        try:
+            payload = json.loads(self._sidecar_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(payload, dict) or payload.get('source') != [st.st_mtime_ns, st.st_size]:
+            return None
+        config = payload.get('config')
+        return config if isinstance(config, dict) else None
+
+    def _write_sidecar(self, st: os.stat_result) -> None:
+        """尽力写入 JSON 旁路缓存；目录不可写（如 Docker 只映射了单个文件）时静默跳过。"""
+        try:
+            dumped = json.dumps(self.config, ensure_ascii=False)
+            # 含 JSON 无法等价表示的值（日期、非字符串键等）时不写，避免读回后与 YAML 语义不一致
+            if json.loads(dumped) != self.config:
+                return
+            payload = '{"source": [%d, %d], "config": %s}' % (st.st_mtime_ns, st.st_size, dumped)
+            # 旁路缓存含完整配置（包括 MUSIC_U cookie）：权限与 config.yaml 保持一致，不按 umask 放宽。
+            # 已存在的旧文件也用 fchmod 收紧，O_CREAT 的 mode 只对新建文件生效（Windows 无 fchmod，跳过）
+            mode = stat.S_IMODE(st.st_mode)
+            fd = os.open(self._sidecar_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+            with open(fd, 'w', encoding='utf-8') as f:
+                if hasattr(os, 'fchmod'):
+                    os.fchmod(fd, mode)
+                f.write(payload)
+        except (OSError, TypeError, ValueError) as e:
+            logging.debug("写入配置 JSON 缓存失败，忽略: %s", e)
+
+    def _matches_disk(self) -> bool:
+        """内存配置是否与磁盘上的文件一致（与最近一次读/写的记录比较，文件 stat 变了即视为不一致）"""
+        cached = self._disk_state
+        if cached is None:
+            return False
+        try:
+            st = self.config_path.stat()
+        except OSError:
+            return False
+        return cached[:2] == (st.st_mtime_ns, st.st_size) and cached[2] == self.config
+
     def get(self, key: str, default: Any = None) -> Any:
         """获取一级配置项（兼容原有逻辑）"""
         return self.config.get(key, default)
@@ -94,35 +248,56 @@ class Config:
         :param default: 路径不存在时的默认返回值
         :return: 配置项的值，或默认值
         """
-        keys = path.split('.')  # 分割路径为键列表（如 ['NAVIDROME', 'NAVIDROME_HOST']）
+        return self.get_nested_tuple(_split_path(path), default)  # 路径拆分结果按路径缓存
+
+    def get_nested_tuple(self, keys: Tuple[str, ...], default: Optional[Any] = None) -> Any:
+        """
+        get_nested 的免拆分版本：直接传入键元组（如 ('WebSecurity', 'API_KEY')）
+        :param keys: 逐层的键
+        :param default: 路径不存在时的默认返回值
+        :return: 配置项的值，或默认值
+        """
+        # 同一路径重复查询直接命中缓存（属性访问走的都是固定路径）
+        if keys in self._nested_cache:
+            current = self._nested_cache[keys]
+            return default if current is _MISSING else current
+
         current = self.config   # 从根配置开始逐层查找
-        
         for key in keys:
             if isinstance(current, dict) and key in current:
                 current = current[key]  # 进入下一层级
             else:
-                return default  # 任何一层不存在，返回默认值
-        
-        return current  # 找到最终值
+                current = _MISSING  # 任何一层不存在，记为缺失并返回默认值
+                break
+
+        self._nested_cache[keys] = current
+        return default if current is _MISSING else current
     
     # 在config.py的Config类中更新save_config方法
     def save_config(self) -> None:
-        """将当前配置保存到yaml文件（增加权限检查）"""
+        """将当前配置保存到yaml文件（无写入权限时抛出 PermissionError）"""
         try:
-            # 检查文件是否存在
-            if self.config_path.exists():
-                # 已存在的文件：检查是否有写入权限
-                if not os.access(self.config_path, os.W_OK):
-                    raise PermissionError(f"配置文件无写入权限: {self.config_path}")
-            else:
-                # 文件不存在：检查父目录是否有写入权限（用于创建新文件）
-                parent_dir = self.config_path.parent
-                if not os.access(parent_dir, os.W_OK):
-                    raise PermissionError(f"配置文件目录无写入权限: {parent_dir}")
+            # 不做 os.access 预检：写入时系统本身就会做权限检查，无权限直接抛 PermissionError（下方统一处理），
+            # 预检既多几次系统调用，也存在检查与写入之间的竞态
+            # 调用方可能已原地修改 self.config：已缓存的层级查询结果作废，属性按当前内存配置重新解析
+            # （无论随后是否真的写盘，属性都与 self.config 一致）
+            self._nested_cache.clear()
+            self._resolve_properties()
+
+            # 文件自上次解析/保存后未被改动，且内容与内存配置一致：无需重写
+            if self._matches_disk():
+                logging.info(f"配置未变化，跳过保存: {self.config_path}")
+                return
 
             # 执行写入
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                yaml.safe_dump(self.config, f, allow_unicode=True, sort_keys=False)
+            yaml, _, dumper = _yaml()
+            self.config_path.write_bytes(
+                yaml.dump(self.config, Dumper=dumper, encoding='utf-8', allow_unicode=True, sort_keys=False)
+            )
+            # 写入后文件 stat 已变，按新 stat 刷新缓存，下次构造直接命中
+            st = self.config_path.stat()
+            self._remember_parsed(st)
+            self._write_sidecar(st)
             logging.info(f"配置已保存到: {self.config_path}")
         except PermissionError as e:
             logging.error(f"权限不足：{str(e)}（请检查docker-compose的文件映射权限）")
@@ -135,53 +310,63 @@ class Config:
     @property
     def allowed_origins(self) -> str:
         """API密钥，用于验证非网页来源的请求"""
-        return self.get_nested('WebSecurity.ALLOWED_ORIGINS', self._defaults['ALLOWED_ORIGINS'])
+        return self._resolved['allowed_origins']
     
     @property
     def api_key(self) -> str:
         """API密钥，用于验证非网页来源的请求"""
-        return self.get_nested('WebSecurity.API_KEY', self._defaults['API_KEY'])
+        return self._resolved['api_key']
 
     @property
     def rate_limit(self) -> str:
         """请求频率限制，格式如"200/hour"（每小时200次）"""
-        return self.get_nested('WebSecurity.RATE_LIMIT', self._defaults['RATE_LIMIT'])
+        return self._resolved['rate_limit']
 
     @property
     def rate_limit_storage(self) -> str:
         """频率限制的存储后端 URI。默认进程内存(memory://，重启/多进程会丢计数)，
         生产环境建议配置为 redis://host:6379 以便多进程/多实例共享计数。"""
-        return self.get_nested('WebSecurity.RATE_LIMIT_STORAGE', self._defaults['RATE_LIMIT_STORAGE'])
+        return self._resolved['rate_limit_storage']
 
     @property
     def ip_whitelist(self) -> list[str]:
         """信任的IP白名单，白名单内的IP无需验证直接访问"""
-        return self.get_nested('WebSecurity.IP_WHITELIST', self._defaults['IP_WHITELIST'])
+        return self._resolved['ip_whitelist']
 
     @property
     def public_endpoints(self) -> list[str]:
         """公开接口路径列表（无需验证）"""
-        return self.get_nested('WebSecurity.PUBLIC_ENDPOINTS', self._defaults['PUBLIC_ENDPOINTS'])
+        return self._resolved['public_endpoints']
 
     @property
     def qr_password(self) -> str:
-        return self.get('QR_PASSWORD', self._defaults['QR_PASSWORD'])
+        return self._resolved['qr_password']
 
     @property
     def web_host(self) -> str:
-        return self.get('web_host', self._defaults['web_host'])
+        return self._resolved['web_host']
     
     @property
     def web_port(self) -> str:
-        return self.get('web_port', self._defaults['web_port'])
+        return self._resolved['web_port']
     
     @property
     def debug(self) -> bool:
-        return self.get('debug', self._defaults['debug'])
+        return self._resolved['debug']
+
+    @property
+    def web_threads(self) -> int:
+        """waitress 工作线程数（仅生产模式使用）"""
+        return int(self._resolved['web_threads'])
+
+    @property
+    def web_connection_limit(self) -> int:
+        """waitress 同时保持的连接上限，超出的新连接排队等待"""
+        return int(self._resolved['web_connection_limit'])
 
     @property
     def cors_origins(self) -> str:
-        return self.get('cors_origins', self._defaults['cors_origins'])
+        return self._resolved['cors_origins']
     
     def __getitem__(self, key: str) -> Any:
         """通过索引获取配置项"""
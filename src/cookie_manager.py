@@ -11,8 +11,25 @@ from pathlib import Path
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import logging
+import re
 from config import Config
 
+# 网易云音乐相关的重要Cookie字段（不可变，各实例共用）
+_IMPORTANT_COOKIES = frozenset({
+    'MUSIC_U',      # 用户标识
+    'MUSIC_A',      # 用户认证
+    '__csrf',       # CSRF令牌
+    'NMTID',        # 设备标识
+    'WEVNSM',       # 会话管理
+    'WNMCID',       # 客户端标识
+})
+
+# Cookie 名称中不允许出现的字符
+_ILLEGAL_NAME_CHARS = frozenset(' \t\n\r;,')
+
+# Cookie 键值对分隔符：分号（浏览器格式）或换行（逐行粘贴）
+_COOKIE_SPLIT = re.compile(r'[;\n]')
+
 @dataclass
 class CookieInfo:
     """Cookie信息数据类"""
@@ -44,30 +61,33 @@ class CookieManager:
         """初始化Cookie管理器（无文件依赖）"""
         self.cookie_string: str = "" # 存储原始Cookie字符串
         self.parsed_cookies: Dict[str, str] = {}  # 解析后的Cookie字典
+        self._request_cookies: Dict[str, str] = {}  # 过滤空值后的请求用Cookie，随 set_cookie_string 更新
         self.config = config
+        self.important_cookies = _IMPORTANT_COOKIES
         self.set_cookie_string(config.get("cookie"))
-        # 网易云音乐相关的重要Cookie字段
-        self.important_cookies = {
-            'MUSIC_U',      # 用户标识
-            'MUSIC_A',      # 用户认证
-            '__csrf',       # CSRF令牌
-            'NMTID',        # 设备标识
-            'WEVNSM',       # 会话管理
-            'WNMCID',       # 客户端标识
-        }
         
     
-    def set_cookie_string(self, cookie_str: str) -> None:
+    def set_cookie_string(self, cookie_str: Optional[str]) -> None:
         """
         设置Cookie原始字符串并解析
         
         Args:
             cookie_string: 从配置获取的Cookie字符串
         """
-        self.cookie_string = cookie_str.strip()
+        # 配置里未填 cookie 时为 None：直接置空，不走 strip/解析
+        self.cookie_string = cookie_str.strip() if cookie_str else ""
         # 立即解析并缓存
-        self.parsed_cookies = self.parse_cookie_string(self.cookie_string)
-        self.logger.debug(f"已设置并解析Cookie，包含 {len(self.parsed_cookies)} 个字段")
+        self.parsed_cookies = self.parse_cookie_string(self.cookie_string) if self.cookie_string else {}
+        # 每次请求都要用，Cookie 变化时过滤一次即可，之后直接复用（调用方只读，不会原地修改）
+        self._request_cookies = {k: v for k, v in self.parsed_cookies.items() if k and v}
+        # 重要字段的命中/缺失同样只随 Cookie 变化，校验与信息展示直接复用
+        self._important_present = _IMPORTANT_COOKIES & self.parsed_cookies.keys()
+        self._important_missing = _IMPORTANT_COOKIES - self._important_present
+        # MUSIC_U 基本有效性（非空且长度 >= 10）
+        self._music_u_ok = len(self.parsed_cookies.get('MUSIC_U', '')) >= 10
+        # 最终校验结论；为 True 时 is_cookie_valid 直接返回，不再逐项检查
+        self._cookie_valid = bool(self.parsed_cookies) and not self._important_missing and self._music_u_ok
+        self.logger.debug("已设置并解析Cookie，包含 %d 个字段", len(self.parsed_cookies))
     
     def parse_cookie_string(self, cookie_string: str) -> Dict[str, str]:
         """解析Cookie字符串
@@ -81,35 +101,17 @@ class CookieManager:
         if not cookie_string or not cookie_string.strip():
             return {}
         
-        cookies = {}
-        
         try:
-            # 处理多种Cookie格式
-            cookie_string = cookie_string.strip()
-            
-            # 分割Cookie项
-            cookie_pairs = []
-            if ';' in cookie_string:
-                cookie_pairs = cookie_string.split(';')
-            elif '\n' in cookie_string:
-                cookie_pairs = cookie_string.split('\n')
-            else:
-                cookie_pairs = [cookie_string]
-            
-            for pair in cookie_pairs:
-                pair = pair.strip()
-                if not pair or '=' not in pair:
-                    continue
-                
-                # 分割键值对
-                key, value = pair.split('=', 1)
+            # 分号或换行分隔均可：一次正则切分 + partition，不再先扫描判断用哪种分隔符
+            cookies = {}
+            for pair in _COOKIE_SPLIT.split(cookie_string):
+                key, sep, value = pair.partition('=')
                 key = key.strip()
                 value = value.strip()
-                
-                if key and value:
+                if sep and key and value:
                     cookies[key] = value
             
-            self.logger.debug(f"解析得到 {len(cookies)} 个Cookie项")
+            self.logger.debug("解析得到 %d 个Cookie项", len(cookies))
             return cookies
             
         except Exception as e:
@@ -125,17 +127,20 @@ class CookieManager:
             if not self.validate_cookie_format(cookie_content):
                 raise CookieException("Cookie格式无效")
             
-            # 更新配置并保存（可能触发权限检查）
-            self.config.config['cookie'] = cookie_content.strip()
+            # 更新配置并保存（可能触发权限检查）。
+            # Cookie 未变化（如重复扫码登录同一账号）时由 save_config 对比磁盘内容跳过重写；
+            # 这里不能只比内存配置——上次保存失败时内存已是新值，磁盘却没写进去
+            cookie_content = cookie_content.strip()
+            self.config.config['cookie'] = cookie_content
             try:
-                self.config.save_config()  # 这里会触发Config类的权限检查
+                self.config.save_config()  # 无写入权限时抛出 PermissionError
             except PermissionError as e:
                 # 针对Docker环境的友好提示
                 raise CookieException(
                     f"无权限写入config.yaml，请检查docker-compose映射的文件权限。详情：{str(e)}"
                 ) from e
             
-            self.set_cookie_string(cookie_content.strip())
+            self.set_cookie_string(cookie_content)
             self.logger.info(f"Cookie已更新到配置文件: {self.config.config_path}")
             return True
             
@@ -178,6 +183,11 @@ class CookieManager:
             if not new_cookies:
                 raise CookieException("新Cookie不能为空")
             
+            # 扫码重复登录同一账号时 MUSIC_U 不变：无需重新拼接、校验与写盘
+            if self.parsed_cookies.get('MUSIC_U') == new_cookies:
+                self.logger.debug("MUSIC_U 未变化，跳过Cookie更新")
+                return True
+            
             # 读取现有Cookie
             existing_cookies = self.parsed_cookies.copy()
             
@@ -200,17 +210,7 @@ class CookieManager:
         Returns:
             适用于requests库的Cookie字典
         """
-        try:
-            cookies = self.parsed_cookies
-            
-            # 过滤掉空值
-            filtered_cookies = {k: v for k, v in cookies.items() if k and v}
-            
-            return filtered_cookies
-            
-        except Exception as e:
-            self.logger.error(f"获取请求Cookie失败: {e}")
-            return {}
+        return self._request_cookies
         
     def validate_cookie_format(self, cookie_string: str) -> bool:
         """验证Cookie格式是否有效
@@ -239,7 +239,7 @@ class CookieManager:
                 if not isinstance(value, str):
                     return False
                 # 检查是否包含非法字符
-                if any(char in name for char in [' ', '\t', '\n', '\r', ';', ',']):
+                if not _ILLEGAL_NAME_CHARS.isdisjoint(name):
                     return False
             
             return True
@@ -253,6 +253,9 @@ class CookieManager:
         Returns:
             Cookie是否有效
         """
+        if self._cookie_valid:
+            return True
+
         try:
             cookies = self.parsed_cookies
             
@@ -261,14 +264,13 @@ class CookieManager:
                 return False
             
             # 检查重要Cookie是否存在
-            missing_cookies = self.important_cookies - set(cookies.keys())
+            missing_cookies = self._important_missing
             if missing_cookies:
-                self.logger.warning(f"缺少重要Cookie: {missing_cookies}")
+                self.logger.warning("缺少重要Cookie: %s", set(missing_cookies))
                 return False
             
             # 检查MUSIC_U是否有效（基本验证）
-            music_u = cookies.get('MUSIC_U', '')
-            if not music_u or len(music_u) < 10:
+            if not self._music_u_ok:
                 self.logger.warning("MUSIC_U Cookie无效")
                 return False
             
@@ -284,21 +286,25 @@ class CookieManager:
         try:
             cookies = self.parsed_cookies
             config_path = self.config.config_path
+            # 只 stat 一次，“是否存在”和“修改时间”都从这一次结果里取
+            try:
+                config_stat = config_path.stat()
+            except OSError:
+                config_stat = None
             
             info = {
                 'config_path': str(config_path),  # 配置文件路径
-                'config_exists': config_path.exists(),
+                'config_exists': config_stat is not None,
                 'cookie_count': len(cookies),
                 'is_valid': self.is_cookie_valid(),
-                'important_cookies_present': list(self.important_cookies & set(cookies.keys())),
-                'missing_important_cookies': list(self.important_cookies - set(cookies.keys())),
+                'important_cookies_present': list(self._important_present),
+                'missing_important_cookies': list(self._important_missing),
                 'all_cookie_names': list(cookies.keys())
             }
             
             # 添加配置文件修改时间
-            if config_path.exists():
-                mtime = config_path.stat().st_mtime
-                info['config_last_modified'] = datetime.fromtimestamp(mtime).isoformat()
+            if config_stat is not None:
+                info['config_last_modified'] = datetime.fromtimestamp(config_stat.st_mtime).isoformat()
             
             return info
             
@@ -321,7 +327,7 @@ class CookieManager:
         if not cookies:
             return ""
         
-        return '; '.join(f"{k}={v}" for k, v in cookies.items() if k and v)
+        return '; '.join([f"{k}={v}" for k, v in cookies.items() if k and v])
     
     def __str__(self) -> str:
         """字符串表示"""
@@ -6,36 +6,46 @@ main.build_download_filename 复用，故独立到此模块。
 """
 
 import re
+from functools import lru_cache
+from urllib.parse import urlparse
 
 # 文件名非法字符（Windows/类 Unix 通用），命中一律替换为 ' & '
 _ILLEGAL_CHARS = re.compile(r'[<>:"/\\|?*]')
 
+# URL 路径后缀 → 可直接使用的扩展名
+_URL_EXTS = frozenset(('flac', 'mp3', 'm4a'))
 
+# Content-Type 关键字 → 扩展名（有序，先命中先返回）
+_CONTENT_TYPE_EXTS = (
+    ('flac', '.flac'),
+    ('mpeg', '.mp3'),
+    ('mp3', '.mp3'),
+    ('mp4', '.m4a'),
+    ('m4a', '.m4a'),
+)
+
+
+# 纯函数：同一首歌被反复解析/下载时（热门曲目很常见）直接命中缓存
+@lru_cache(maxsize=4096)
 def sanitize_filename(filename: str) -> str:
     """清理文件名：替换非法字符、去除首尾空格与点、限制长度。空则回退 'unknown'。"""
-    filename = _ILLEGAL_CHARS.sub(' & ', filename)
-    filename = filename.strip(' .')
-    if len(filename) > 200:
-        filename = filename[:200]
-    return filename or "unknown"
+    # 常见情况是干净文件名：先 search 短路，命中才 sub，省一次新字符串分配
+    if _ILLEGAL_CHARS.search(filename):
+        filename = _ILLEGAL_CHARS.sub(' & ', filename)
+    return filename.strip(' .')[:200] or "unknown"
 
 
 def file_extension(url: str, content_type: str = "") -> str:
     """按下载 URL、其次 Content-Type 推断扩展名（.flac/.mp3/.m4a），无法判断默认 .mp3。"""
-    lowered = url.lower()
-    if '.flac' in lowered:
-        return '.flac'
-    if '.mp3' in lowered:
-        return '.mp3'
-    if '.m4a' in lowered:
-        return '.m4a'
+    # 只取 URL path 的后缀：签名 CDN 链接的 query 往往很长，不必整串转小写再逐个子串扫描
+    ext = urlparse(url).path.rpartition('.')[2].lower()
+    if ext in _URL_EXTS:
+        return '.' + ext
 
+    # Content-Type 很短（如 audio/x-flac），按优先级顺序做子串匹配
     content_type = content_type.lower()
-    if 'flac' in content_type:
-        return '.flac'
-    if 'mpeg' in content_type or 'mp3' in content_type:
-        return '.mp3'
-    if 'mp4' in content_type or 'm4a' in content_type:
-        return '.m4a'
+    for token, suffix in _CONTENT_TYPE_EXTS:
+        if token in content_type:
+            return suffix
 
     return '.mp3'
@@ -1,14 +1,30 @@
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 import sys
 from typing import Optional
 
+# 后台写日志的监听线程：请求线程只把记录放进队列，控制台/文件的实际写入在这里完成
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """停止监听线程（会先把队列中剩余的记录写完）"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def setup_logger(level: int = logging.INFO) -> logging.Logger:
     """配置日志系统（确保控制台和文件输出正常）"""
     # 1. 获取根日志器（确保全局唯一）
     logger = logging.getLogger()
-    # 清除已有处理器（避免重复输出，解决首次配置失败后无法重试的问题）
+    # 清除已有处理器（避免重复输出，解决首次配置失败后无法重试的问题）；旧的监听线程一并停掉
+    _stop_listener()
     if logger.handlers:
         logger.handlers.clear()
     
@@ -41,15 +57,24 @@ def setup_logger(level: int = logging.INFO) -> logging.Logger:
         file_handler = None
         print(f"警告：无权限写入日志文件 {log_file}，仅输出到控制台")  # 降级提示
     
-    # 7. 配置根日志
-    logger.setLevel(level)
-    logger.addHandler(console_handler)  # 确保添加控制台处理器
+    # 7. 配置根日志：根日志只挂 QueueHandler，控制台/文件写入交给后台监听线程，
+    # 请求线程不再因 stdout 或磁盘写入阻塞
+    handlers = [console_handler]
     if file_handler:
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    global _listener
+    _listener = QueueListener(queue.SimpleQueue(), *handlers, respect_handler_level=True)
+    _listener.start()
+    logger.setLevel(level)
+    logger.addHandler(QueueHandler(_listener.queue))
     
     # 调试：确认处理器已添加
-    logger.debug(f"日志系统初始化完成，级别：{logging.getLevelName(level)}")
-    logger.debug(f"控制台处理器已添加：{bool(console_handler in logger.handlers)}")
-    logger.debug(f"文件日志路径：{log_file if file_handler else '无'}")
+    logger.debug("日志系统初始化完成，级别：%s", logging.getLevelName(level))
+    logger.debug("控制台处理器已添加：%s", console_handler in _listener.handlers)
+    logger.debug("文件日志路径：%s", log_file if file_handler else '无')
     
-    return logger
\ No newline at end of file
+    return logger
+
+
+# 进程退出时停止监听线程，确保缓冲在队列里的日志全部落盘
+atexit.register(_stop_listener)
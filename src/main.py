@@ -12,26 +12,39 @@
 服务端不落地文件、不写标签，下载由浏览器完成。
 """
 
+import gc
 import logging
 import os
+import re
 import sys
 import time
-import traceback
 import ipaddress
-import requests
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from collections import ChainMap
+from typing import Dict, Any, Mapping, Optional, Tuple
 from urllib.parse import urlparse
-from flask import Flask, jsonify, request, render_template, Response
+from flask import Flask, request, render_template, Response
+from flask.json.provider import DefaultJSONProvider
 from config import Config
 from logger import setup_logger
 
 from flask_limiter import Limiter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from waitress import serve
+except ImportError:
+    serve = None
+
 try:
     from music_api import (
         NeteaseAPI, APIException, QualityLevel, QRLoginManager,
-        url_v1, name_v1, lyric_v1, playlist_detail, album_detail,
+        url_v1, name_v1, lyric_v1, playlist_detail, album_detail, IO_EXECUTOR, SESSION,
+        shutdown_io_executor, _ARTIST_NAME,
     )
     from cookie_manager import CookieManager, CookieException
     from filename import sanitize_filename, file_extension
@@ -42,7 +55,39 @@ except ImportError as e:
 
 
 # 支持的音质等级（取自 QualityLevel 枚举，避免在各路由重复硬编码同一份列表）
-VALID_QUALITIES = [q.value for q in QualityLevel]
+VALID_QUALITIES = frozenset(q.value for q in QualityLevel)
+# 校验失败时的错误提示，按枚举顺序列出，模块加载时拼好
+INVALID_QUALITY_MESSAGE = f"无效的音质参数，支持: {', '.join(q.value for q in QualityLevel)}"
+
+# 文件大小单位（1024 进制）
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# 网易云链接中的歌曲ID（?id=123 或 &id=123；不会误匹配 userid= 之类的参数）
+_MUSIC_ID_RE = re.compile(r'[?&]id=(\d+)')
+
+# 音质等级 → 显示名称
+QUALITY_DISPLAY_NAMES = {
+    'standard': "标准音质",
+    'exhigh': "极高音质",
+    'lossless': "无损音质",
+    'hires': "Hi-Res音质",
+    'sky': "沉浸环绕声",
+    'jyeffect': "高清环绕声",
+    'jymaster': "超清母带",
+}
+
+# /song 支持的 type 参数
+_SONG_INFO_TYPES = ('url', 'name', 'lyric', 'json')
+VALID_TYPES = frozenset(_SONG_INFO_TYPES)
+INVALID_TYPE_MESSAGE = f"无效的类型参数，支持: {', '.join(_SONG_INFO_TYPES)}"
+
+
+def _safe_lyric(lyric_info: Optional[Dict[str, Any]], key: str) -> str:
+    """取歌词接口返回里 lrc/tlyric 的歌词文本，缺失时返回空串（不再为 .get(key, {}) 每次新建空字典）"""
+    if not lyric_info:
+        return ''
+    sub = lyric_info.get(key)
+    return sub.get('lyric', '') if sub else ''
 
 
 class APIResponse:
@@ -88,52 +133,54 @@ class MusicAPIService:
         return self._user_config
 
     def _get_cookies(self) -> Dict[str, str]:
-        """获取Cookie"""
+        """获取Cookie（CookieManager 在 Cookie 变化时已解析并缓存，这里直接取用，不再逐请求重新解析）"""
         try:
-            cookie_str = self.cookie_manager.cookie_string
-            return self.cookie_manager.parse_cookie_string(cookie_str)
+            return self.cookie_manager.get_cookie_for_request()
         except CookieException as e:
-            self.logger.warning(f"获取Cookie失败: {e}")
+            self.logger.warning("获取Cookie失败: %s", e)
             return {}
         except Exception as e:
-            self.logger.error(f"Cookie处理异常: {e}")
+            self.logger.error("Cookie处理异常: %s", e)
             return {}
 
     def _extract_music_id(self, id_or_url: str) -> str:
         """提取音乐ID"""
+        # 绝大多数请求直接传纯数字ID：直接返回，跳过短链接/网页链接的判断
+        music_id = str(id_or_url).strip()
+        if music_id.isdigit():
+            return music_id
+
         try:
             # 处理短链接
             if '163cn.tv' in id_or_url:
-                response = requests.get(id_or_url, allow_redirects=False, timeout=10)
-                id_or_url = response.headers.get('Location', id_or_url)
+                # 复用 music_api 的共享 Session（连接池），只要 302 的 Location 头，stream=True 不读响应体
+                with SESSION.get(id_or_url, allow_redirects=False, stream=True, timeout=10) as response:
+                    id_or_url = response.headers.get('Location', id_or_url)
 
             # 处理网易云链接
             if 'music.163.com' in id_or_url:
-                index = id_or_url.find('id=') + 3
-                if index > 2:
-                    return id_or_url[index:].split('&')[0]
+                match = _MUSIC_ID_RE.search(id_or_url)
+                if match:
+                    return match.group(1)
 
             # 直接返回ID
             return str(id_or_url).strip()
 
         except Exception as e:
-            self.logger.error(f"提取音乐ID失败: {e}")
+            self.logger.error("提取音乐ID失败: %s", e)
             return str(id_or_url).strip()
 
     def _format_file_size(self, size_bytes: int) -> str:
         """格式化文件大小"""
         if size_bytes == 0:
             return "0B"
+        if size_bytes < 1024:
+            # 不足 1KB（含负数与小数）：原样按字节输出
+            return f"{size_bytes:.2f}B"
 
-        units = ["B", "KB", "MB", "GB", "TB"]
-        size = float(size_bytes)
-        unit_index = 0
-
-        while size >= 1024.0 and unit_index < len(units) - 1:
-            size /= 1024.0
-            unit_index += 1
-
-        return f"{size:.2f}{units[unit_index]}"
+        # 单位档位 = 二进制位数每 10 位一档（1024 进制），一次算出，不再循环除
+        unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (10 * unit_index)):.2f}{_SIZE_UNITS[unit_index]}"
 
     def build_download_filename(self, name: str, artists, url: str = "") -> str:
         """统一生成下载文件名：『歌手 - 歌曲名.<ext>』。
@@ -146,7 +193,7 @@ class MusicAPIService:
             url: 下载链接，用于推断扩展名；为空则不追加扩展名
         """
         if isinstance(artists, (list, tuple)):
-            artist_str = '&'.join(a for a in artists if a) or '未知艺术家'
+            artist_str = '&'.join([a for a in artists if a]) or '未知艺术家'
         else:
             artist_str = (artists or '').strip() or '未知艺术家'
         title = (name or '').strip() or '未知歌曲'
@@ -165,25 +212,32 @@ class MusicAPIService:
         """
         music_id = self._extract_music_id(music_id)
 
+        # 基本信息 / 下载链接 / 歌词三者互不依赖，并发发出；专辑详情依赖基本信息里的专辑ID
+        song_future = IO_EXECUTOR.submit(name_v1, music_id)
+        url_future = IO_EXECUTOR.submit(url_v1, music_id, quality, cookies)
+        lyric_future = IO_EXECUTOR.submit(lyric_v1, music_id, cookies)
+
         # 基本信息
-        song_info = name_v1(music_id)
+        song_info = song_future.result()
         if not song_info or 'songs' not in song_info or not song_info['songs']:
             return None, APIResponse.error("未找到歌曲信息", 404)
 
+        # 专辑详情以提取更准确的发行时间（拿到专辑ID后立即发出，与下载链接/歌词重叠）
+        al = song_info['songs'][0].get('al') or {}
+        album_future = IO_EXECUTOR.submit(self.netease_api.get_album_detail, al['id'], cookies) if al.get('id') else None
+
         # 下载链接
-        url_info = url_v1(music_id, quality, cookies)
+        url_info = url_future.result()
         if not url_info or 'data' not in url_info or not url_info['data'] or not url_info['data'][0].get('url'):
             return None, APIResponse.error("无法获取音乐下载链接，可能是版权限制或音质不支持", 404)
 
         # 歌词
-        lyric_info = lyric_v1(music_id, cookies)
+        lyric_info = lyric_future.result()
 
         song_data = song_info['songs'][0]
         url_data = url_info['data'][0]
 
-        # 专辑详情以提取更准确的发行时间
-        al = song_data.get('al') or {}
-        alum_info = self.netease_api.get_album_detail(al['id'], cookies) if al.get('id') else None
+        alum_info = album_future.result() if album_future else None
         publish_timestamp = ''
         if alum_info and 'publishTime' in alum_info:
             publish_timestamp = alum_info.get('publishTime', al.get('publishTime', 0))
@@ -207,23 +261,14 @@ class MusicAPIService:
             'publishTime': publish_time,
             'filename': self.build_download_filename(title, artists_list, url_data['url']),
             'track_number': song_data.get('no', 0),
-            'lyric': lyric_info.get('lrc', {}).get('lyric', '') if lyric_info else '',
-            'tlyric': lyric_info.get('tlyric', {}).get('lyric', '') if lyric_info else '',
+            'lyric': _safe_lyric(lyric_info, 'lrc'),
+            'tlyric': _safe_lyric(lyric_info, 'tlyric'),
         }
         return music_info, None
 
     def _get_quality_display_name(self, quality: str) -> str:
         """获取音质显示名称"""
-        quality_names = {
-            'standard': "标准音质",
-            'exhigh': "极高音质",
-            'lossless': "无损音质",
-            'hires': "Hi-Res音质",
-            'sky': "沉浸环绕声",
-            'jyeffect': "高清环绕声",
-            'jymaster': "超清母带"
-        }
-        return quality_names.get(quality, f"未知音质({quality})")
+        return QUALITY_DISPLAY_NAMES.get(quality) or f"未知音质({quality})"
 
     def _validate_request_params(self, required_params: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], int]]:
         """验证请求参数"""
@@ -232,29 +277,58 @@ class MusicAPIService:
                 return APIResponse.error(f"参数 '{param_name}' 不能为空", 400)
         return None
 
-    def _safe_get_request_data(self) -> Dict[str, Any]:
-        """安全获取请求数据"""
+    def _safe_get_request_data(self) -> Mapping[str, Any]:
+        """安全获取请求数据（只读映射，调用方只 .get() 单个键，不再整份拷贝成 dict）"""
         try:
             if request.method == 'GET':
-                return dict(request.args)
-            else:
-                # 优先使用JSON数据，然后是表单数据
-                json_data = request.get_json(silent=True) or {}
-                form_data = dict(request.form)
-                # 合并数据，JSON优先
-                return {**form_data, **json_data}
+                return request.args
+            # 优先使用JSON数据，然后是表单数据
+            json_data = request.get_json(silent=True)
+            if not isinstance(json_data, dict) or not json_data:
+                return request.form
+            if not request.form:
+                return json_data
+            # 两者都有时合并查找，JSON优先
+            return ChainMap(json_data, request.form)
         except Exception as e:
-            self.logger.error(f"获取请求数据失败: {e}")
+            self.logger.error("获取请求数据失败: %s", e)
             return {}
 
 
+class ORJSONProvider(DefaultJSONProvider):
+    """orjson 版 JSON provider：序列化/解析在 C 里完成，歌单、专辑这类大列表响应省下大部分 JSON 开销。
+
+    保持默认 provider 的可见行为：按 sort_keys 排序键、debug 下缩进、非字符串键转为字符串，
+    orjson 不认识的类型交给默认 provider 的 default 处理。
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 # 创建Flask应用和服务实例
 user_config = Config()
+
+# 导入时即初始化日志：无论是直接运行还是被 WSGI 服务器导入，第一个请求到来前日志都已配置好
+LOG_LEVEL = user_config.get("LEVEL", "INFO")
+_log_level = getattr(logging, str(LOG_LEVEL).upper(), logging.INFO)
+setup_logger(_log_level if isinstance(_log_level, int) else logging.INFO)
+
 # 显式指定 static/templates 绝对路径，避免 Docker 中工作目录差异导致 CSS/JS 加载失败
 current_dir = Path(__file__).parent
 app = Flask(__name__,
             static_folder=str(current_dir / 'static'),
             template_folder=str(current_dir / 'templates'))
+if orjson is not None:
+    app.json = ORJSONProvider(app)
 api_service = MusicAPIService(user_config)
 APP_VERSION = os.getenv("APP_VERSION", "unknown")
 
@@ -303,9 +377,10 @@ limiter = Limiter(
 def before_request():
     """请求前处理：包含日志记录和安全检查"""
     # 1. 记录请求信息
+    # 惰性 % 格式化：日志级别高于 INFO 时不拼接字符串（每个请求都会走到这里）
     api_service.logger.info(
-        f"{request.method} {request.path} - IP: {request.remote_addr} - "
-        f"User-Agent: {request.headers.get('User-Agent', 'Unknown')}"
+        "%s %s - IP: %s - User-Agent: %s",
+        request.method, request.path, request.remote_addr, request.headers.get('User-Agent', 'Unknown')
     )
 
     # 2. 安全检查逻辑
@@ -317,7 +392,7 @@ def before_request():
             if client_ip_obj in ipaddress.ip_network(ip, strict=False):
                 return None  # IP在白名单内，直接放行
     except ValueError:
-        api_service.logger.warning(f"无效的IP白名单配置或客户端IP: {user_config.ip_whitelist} / {client_ip}")
+        api_service.logger.warning("无效的IP白名单配置或客户端IP: %s / %s", user_config.ip_whitelist, client_ip)
 
     # 2.2 跳过公开接口
     if any(request.path == ep for ep in user_config.public_endpoints):
@@ -394,7 +469,7 @@ def handle_not_found(e):
 @app.errorhandler(500)
 def handle_internal_error(e):
     """处理500错误"""
-    api_service.logger.error(f"服务器内部错误: {e}")
+    api_service.logger.error("服务器内部错误: %s", e)
     return APIResponse.error("服务器内部错误", 500)
 
 
@@ -404,6 +479,14 @@ def index():
     return render_template("index.html", app_version=APP_VERSION)
 
 
+# /api/check-password 只有两种固定结果：启动时序列化好，请求时直接返回字节，不再每次构造 dict + 编码
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+_CHECK_PASSWORD_RESPONSES = {
+    ok: (app.json.dumps({'success': ok, 'message': message}) + "\n", _JSON_HEADERS)
+    for ok, message in ((True, '密码验证成功'), (False, '密码错误'))
+}
+
+
 @app.route('/api/check-password', methods=['GET'])
 @limiter.limit("30/minute")
 def check_password() -> str:
@@ -412,9 +495,7 @@ def check_password() -> str:
     # 从配置获取正确密码
     qr_password = user_config.qr_password
     # 验证密码
-    if user_password.strip() == str(qr_password).strip():
-        return jsonify({'success': True, 'message': '密码验证成功'})
-    return jsonify({'success': False, 'message': '密码错误'})
+    return _CHECK_PASSWORD_RESPONSES[user_password.strip() == str(qr_password).strip()]
 
 
 @app.route('/health', methods=['GET'])
@@ -431,7 +512,7 @@ def health_check():
         }
         return APIResponse.success(health_info, "API服务运行正常")
     except Exception as e:
-        api_service.logger.error(f"健康检查失败: {e}")
+        api_service.logger.exception("健康检查失败: %s", e)
         return APIResponse.error(f"健康检查失败: {str(e)}", 500)
 
 
@@ -456,12 +537,11 @@ def get_song_info():
 
         # 验证音质参数
         if level not in VALID_QUALITIES:
-            return APIResponse.error(f"无效的音质参数，支持: {', '.join(VALID_QUALITIES)}")
+            return APIResponse.error(INVALID_QUALITY_MESSAGE)
 
         # 验证类型参数
-        valid_types = ['url', 'name', 'lyric', 'json']
-        if info_type not in valid_types:
-            return APIResponse.error(f"无效的类型参数，支持: {', '.join(valid_types)}")
+        if info_type not in VALID_TYPES:
+            return APIResponse.error(INVALID_TYPE_MESSAGE)
 
         cookies = api_service._get_cookies()
 
@@ -494,10 +574,13 @@ def get_song_info():
             return APIResponse.success(result, "获取歌词成功")
 
         elif info_type == 'json':
-            # 获取完整的歌曲信息（用于前端解析）
-            song_info = name_v1(music_id)
-            url_info = url_v1(music_id, level, cookies)
-            lyric_info = lyric_v1(music_id, cookies)
+            # 获取完整的歌曲信息（用于前端解析）；三个接口互不依赖，并发发出
+            song_future = IO_EXECUTOR.submit(name_v1, music_id)
+            url_future = IO_EXECUTOR.submit(url_v1, music_id, level, cookies)
+            lyric_future = IO_EXECUTOR.submit(lyric_v1, music_id, cookies)
+            song_info = song_future.result()
+            url_info = url_future.result()
+            lyric_info = lyric_future.result()
 
             if not song_info or 'songs' not in song_info or not song_info['songs']:
                 return APIResponse.error("未找到歌曲信息", 404)
@@ -508,13 +591,13 @@ def get_song_info():
             response_data = {
                 'id': music_id,
                 'name': song_data.get('name', ''),
-                'ar_name': ', '.join(artist['name'] for artist in song_data.get('ar', [])),
+                'ar_name': ', '.join(map(_ARTIST_NAME, song_data.get('ar', []))),
                 'al_name': song_data.get('al', {}).get('name', ''),
                 'pic': song_data.get('al', {}).get('picUrl', ''),
                 'duration': song_data.get('dt', 0),
                 'level': level,
-                'lyric': lyric_info.get('lrc', {}).get('lyric', '') if lyric_info else '',
-                'tlyric': lyric_info.get('tlyric', {}).get('lyric', '') if lyric_info else ''
+                'lyric': _safe_lyric(lyric_info, 'lrc'),
+                'tlyric': _safe_lyric(lyric_info, 'tlyric')
             }
 
             # 添加URL和大小信息
@@ -530,10 +613,10 @@ def get_song_info():
             return APIResponse.success(response_data, "获取歌曲URL成功")
 
     except APIException as e:
-        api_service.logger.error(f"API调用失败: {e}")
+        api_service.logger.error("API调用失败: %s", e)
         return APIResponse.error(f"API调用失败: {str(e)}", 500)
     except Exception as e:
-        api_service.logger.error(f"获取歌曲信息异常: {e}\n{traceback.format_exc()}")
+        api_service.logger.exception("获取歌曲信息异常: %s", e)
         return APIResponse.error(f"服务器错误: {str(e)}", 500)
 
 
@@ -547,7 +630,7 @@ def song_detail_api():
         try:
             is_cookie_valid = api_service.netease_api.is_cookie_valid(cookies)
         except Exception as e:
-            api_service.logger.error(f"Cookie有效性检查异常: {e}")
+            api_service.logger.error("Cookie有效性检查异常: %s", e)
             return APIResponse.error("Cookie验证失败，请重试", 500)
 
         if not is_cookie_valid:
@@ -563,7 +646,7 @@ def song_detail_api():
             return validation_error
 
         if quality not in VALID_QUALITIES:
-            return APIResponse.error(f"无效的音质参数，支持: {', '.join(VALID_QUALITIES)}")
+            return APIResponse.error(INVALID_QUALITY_MESSAGE)
 
         # 3. 解析单曲完整信息（含下载直链，浏览器据此直接下载）
         music_info, error = api_service.resolve_song_info(music_id, quality, cookies)
@@ -573,7 +656,7 @@ def song_detail_api():
         return APIResponse.success(music_info, "歌曲详情获取成功")
 
     except Exception as e:
-        api_service.logger.error(f"获取歌曲详情异常: {e}\n{traceback.format_exc()}")
+        api_service.logger.exception("获取歌曲详情异常: %s", e)
         return APIResponse.error(f"获取歌曲详情失败: {str(e)}", 500)
 
 
@@ -600,7 +683,7 @@ def get_playlist():
         return APIResponse.success(response_data, "获取歌单详情成功")
 
     except Exception as e:
-        api_service.logger.error(f"获取歌单异常: {e}\n{traceback.format_exc()}")
+        api_service.logger.exception("获取歌单异常: %s", e)
         return APIResponse.error(f"获取歌单失败: {str(e)}", 500)
 
 
@@ -627,7 +710,7 @@ def get_album():
         return APIResponse.success(response_data, "获取专辑详情成功")
 
     except Exception as e:
-        api_service.logger.error(f"获取专辑异常: {e}\n{traceback.format_exc()}")
+        api_service.logger.exception("获取专辑异常: %s", e)
         return APIResponse.error(f"获取专辑失败: {str(e)}", 500)
 
 
@@ -642,10 +725,16 @@ def generate_qr():
         else:
             return APIResponse.error(result['message'], 500)
     except Exception as e:
-        api_service.logger.error(f"生成二维码异常: {e}")
+        api_service.logger.exception("生成二维码异常: %s", e)
         return APIResponse.error(f"生成二维码失败: {str(e)}", 500)
 
 
+# 扫码轮询绝大多数返回的是这几个不带 cookie 的中间状态，响应体只取决于 (状态码, 提示语)：
+# 首次遇到时序列化并记下，之后的轮询直接返回同一份字节
+_QR_PENDING_CODES = frozenset((800, 801, 802))
+_QR_PENDING_RESPONSES: Dict[Tuple[int, str], Tuple[str, int, Dict[str, str]]] = {}
+
+
 @app.route('/api/qr/check', methods=['GET'])
 @limiter.limit("10/minute")
 def check_qr_status():
@@ -656,6 +745,14 @@ def check_qr_status():
             return APIResponse.error("缺少qr_key参数", 400)
 
         result = api_service.qr_manager.check_login_status(qr_key)
+        if result['success'] and result.get('status_code') in _QR_PENDING_CODES:
+            key = (result['status_code'], result['message'])
+            cached = _QR_PENDING_RESPONSES.get(key)
+            if cached is None:
+                body, status = APIResponse.success(result, "检查二维码状态成功")
+                cached = _QR_PENDING_RESPONSES[key] = (app.json.dumps(body) + "\n", status, _JSON_HEADERS)
+            return cached
+
         if result['success']:
             # 如果登录成功，保存cookie
             if result.get('status_code') == 803 and 'cookie' in result:
@@ -673,14 +770,14 @@ def check_qr_status():
                     else:
                         api_service.logger.info("登录成功，但非VIP用户，不保存cookie")
                 except Exception as e:
-                    api_service.logger.warning(f"保存cookie失败: {e}")
+                    api_service.logger.warning("保存cookie失败: %s", e)
                     result['is_vip'] = False
 
             return APIResponse.success(result, "检查二维码状态成功")
         else:
             return APIResponse.error(result['message'], 500)
     except Exception as e:
-        api_service.logger.error(f"检查二维码状态异常: {e}")
+        api_service.logger.exception("检查二维码状态异常: %s", e)
         return APIResponse.error(f"检查二维码状态失败: {str(e)}", 500)
 
 
@@ -696,42 +793,60 @@ def check_cookie():
             "Cookie状态检查成功"
         )
     except Exception as e:
-        api_service.logger.error(f"检查Cookie状态异常: {e}")
+        api_service.logger.exception("检查Cookie状态异常: %s", e)
         return APIResponse.error(f"检查Cookie状态失败: {str(e)}", 500)
 
 
+# 启动完成后放宽分代 GC 的触发阈值：请求期间分配的多是短命小对象，
+# 默认 700 次分配就触发一次年轻代回收过于频繁
+GC_THRESHOLD = (100_000, 10, 10)
+
+
 def start_api_server():
     """启动API服务器"""
     try:
-        # 初始化日志
-        level = user_config.get("LEVEL", "INFO")
-        log_level = getattr(logging, str(level).upper(), logging.INFO)
-        if not isinstance(log_level, int):
-            log_level = logging.INFO
-        setup_logger(log_level)
-
         print("\n" + "=" * 60)
         print("🚀 网易云音乐解析下载服务启动中...")
         print("=" * 60)
         print(f"📡 服务地址: http://{user_config.web_host}:{user_config.web_port}")
-        print(f"📋 日志级别: {level}")
+        print(f"📋 日志级别: {LOG_LEVEL}")
         print(f"⏰ 启动时间: {time.strftime('%Y-%m-%d %H:%M:%S')}")
         print("🌟 服务已就绪，等待请求...\n")
 
-        # 启动Flask应用
-        app.run(
-            host=user_config.web_host,
-            port=user_config.web_port,
-            debug=user_config.debug,
-            threaded=True
-        )
+        # app、api_service、路由表、正则等启动期对象会常驻到进程结束。先回收一次启动垃圾，
+        # 再把存活对象移入永久代，之后的每次 GC 只需遍历请求期间产生的对象
+        gc.collect()
+        gc.freeze()
+        gc.set_threshold(*GC_THRESHOLD)
+
+        if user_config.debug or serve is None:
+            # 调试模式（热重载）或未安装 waitress：使用 Flask 自带的开发服务器
+            app.run(
+                host=user_config.web_host,
+                port=user_config.web_port,
+                debug=user_config.debug,
+                threaded=True
+            )
+        else:
+            # 生产模式：waitress 多线程 WSGI 服务器。保持单进程，进程内的限流计数（memory://）、
+            # 元信息缓存与扫码登录状态都无需跨进程共享；上游请求是 I/O 等待，线程池足以并发处理
+            serve(
+                app,
+                host=user_config.web_host,
+                port=int(user_config.web_port),
+                threads=user_config.web_threads,
+                connection_limit=user_config.web_connection_limit,
+            )
 
     except KeyboardInterrupt:
         print("\n\n👋 服务已停止")
     except Exception as e:
-        logging.error(f"程序启动失败: {str(e)}", exc_info=True)
+        logging.error("程序启动失败: %s", e, exc_info=True)
         print(f"❌ 启动失败: {e}")
         sys.exit(1)
+    finally:
+        # 服务器已退出：丢弃 I/O 线程池里还在排队的接口请求，免得解释器收尾时逐个跑完才退出
+        shutdown_io_executor()
 
 
 if __name__ == '__main__':
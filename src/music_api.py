@@ -79,28 +79,176 @@
 import base64
 from io import BytesIO
 import json
+import os
 import urllib.parse
 import time
-from random import randrange
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, deque
+from functools import lru_cache, wraps
+from itertools import count
+from operator import itemgetter
+from random import randrange, uniform
 from typing import Dict, List, Optional, Tuple, Any
 from hashlib import md5
 from enum import Enum
+from types import MappingProxyType
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from cryptography.hazmat.primitives import padding
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 二维码生成（qrcode）与出图（Pillow）分别检测：控制台扫码只需要 qrcode，缺哪个就提示装哪个
 try:
     import qrcode
-    from PIL import Image
 except ImportError:
     qrcode = None
+
+try:
+    from PIL import Image
+except ImportError:
     Image = None
 
 # 模块级共享 Session：网易云接口都打到同几个域名，复用连接池可省去每次请求的 TCP/TLS 握手。
 # requests.Session 在多线程下发请求是安全的，契合 Flask 的 threaded=True 运行方式。
 SESSION = requests.Session()
 
+# 连接池按域名缓存，默认每域名只留 10 条连接；Waitress 工作线程 + IO_EXECUTOR 并发时会不断
+# 丢弃、重建连接。放大池子让 keep-alive 连接都能被留下复用。
+# 重试只针对连接失败与 5xx/429，且 urllib3 默认只重试幂等方法（GET/HEAD 等），不会重放 POST。
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504),
+                      raise_on_status=False),
+)
+SESSION.mount('http://', _HTTP_ADAPTER)
+SESSION.mount('https://', _HTTP_ADAPTER)
+
+# 请求超时（连接, 读取）秒：服务端失联时连接阶段几秒内就失败；
+# 读取超时是两次收到数据之间的间隔上限，大歌单响应持续传输时不受影响
+_HTTP_TIMEOUT = (3.05, 10)
+
+# 模块级共享 I/O 线程池：同一次解析里互不依赖的接口调用（详情/直链/歌词）并发发出，
+# 总耗时由 3×RTT 降为约 1×RTT。线程数封顶，避免并发请求多时无限开线程打满上游。
+# 纯网络等待，线程数按 2×CPU 放大，但不少于 8（小容器里仍能让一次解析的几路请求并发）、不多于 32。
+_IO_WORKERS = min(32, max(8, (os.cpu_count() or 4) * 2))
+IO_EXECUTOR = ThreadPoolExecutor(max_workers=_IO_WORKERS, thread_name_prefix="netease-io")
+
+
+# 歌单曲目详情：每批请求的歌曲数，以及同一歌单同时在途的批次上限
+_PLAYLIST_BATCH_SIZE = 100
+_PLAYLIST_BATCH_CONCURRENCY = 4
+
+
+def shutdown_io_executor() -> None:
+    """停止共享 I/O 线程池：丢弃尚未开始的任务，不等待正在执行的请求。
+
+    须在服务器退出后、解释器收尾前调用：concurrent.futures 自己的退出钩子先于 atexit 回调运行，
+    会等所有排队任务执行完，届时再 cancel 已无事可做。
+    """
+    IO_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+
+
+class _TTLCache:
+    """线程安全的小型 TTL + LRU 缓存。
+
+    歌曲详情、歌词这类元信息在网易云侧几乎不变，前端会对同一首歌反复解析/下载，
+    缓存后可省去重复的 HTTP 往返。条目数封顶，超出时淘汰最久未用的。
+    """
+
+    _MISSING = object()
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """命中返回缓存值，未命中或已过期返回 _TTLCache._MISSING"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return self._MISSING
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return self._MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self._ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+
+# 解析网易云响应的 JSON：装了 orjson 就用它（C 实现，歌单批量详情这类几百 KB 的响应快数倍），否则退回标准库。
+# 两者都直接接受 bytes，且 orjson.JSONDecodeError 是 json.JSONDecodeError 的子类，原有 except 分支照常生效。
+# 只用于解析：eapi 加密前的 payload 仍由 json.dumps 生成，保持请求体格式不变
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+# 艺人名取值器：歌单/专辑每首歌都要拼艺人名，map(itemgetter) 在 C 里循环，比生成器表达式省开销
+_ARTIST_NAME = itemgetter('name')
+
+
+# 时间戳位数区间：10位为秒级，11-13位为毫秒级；上限为 2100-12-31 23:59:59（毫秒级）
+_TS_SECONDS_MIN = 10 ** 9
+_TS_MILLIS_MIN = 10 ** 10
+_TS_MILLIS_END = 10 ** 13
+_TS_MAX_MS = 4102444799000
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp_ms(timestamp_ms: int) -> str:
+    """毫秒级时间戳 → YYYY-MM-DD（本地时区）"""
+    return datetime.fromtimestamp(timestamp_ms / 1000).strftime("%Y-%m-%d")
+
+
+# 元信息缓存（按歌曲ID）。下载直链会过期、且与音质/账号相关，不放进这里。
+_SONG_DETAIL_CACHE = _TTLCache(maxsize=1024, ttl=600)
+_LYRIC_CACHE = _TTLCache(maxsize=1024, ttl=600)
+# 专辑详情（单曲解析时用来取发行时间，同专辑的曲目反复命中）
+_ALBUM_DETAIL_CACHE = _TTLCache(maxsize=256, ttl=600)
+# 下载直链：与音质、账号相关，按 (歌曲ID, 音质, MUSIC_U) 缓存。网易云直链约 20 分钟过期，
+# TTL 取 5 分钟，远短于有效期；前端先解析再逐首下载时，同一首歌不必再签一次直链
+_SONG_URL_CACHE = _TTLCache(maxsize=512, ttl=300)
+
+
+# 网易云封面图片ID加密用的异或密钥
+_PIC_ID_MAGIC = b'3go8&$8*3*3h0k(2)2'
+
+
+# 封面直链模板（加密ID, 封面ID, 尺寸, 尺寸）：固定模板用 % 格式化，逐首拼 URL 时开销最小
+_PIC_URL_TEMPLATE = 'https://p3.music.126.net/%s/%s.jpg?param=%sy%s'
+
+
+# 纯函数：同专辑的曲目共用一个封面ID，歌单/专辑列表里大量重复，缓存后每个封面只算一次 md5
+@lru_cache(maxsize=8192)
+def _encrypt_pic_id(id_str: str) -> str:
+    """网易云封面图片ID加密（NeteaseAPI.netease_encrypt_id 的实现）"""
+    # 图片ID是纯数字（ASCII）：按字节与循环展开的 magic 整体异或，用大整数在 C 里一次完成，
+    # 结果与逐字符 chr(ord ^ ord) 再 UTF-8 编码完全一致
+    data = id_str.encode('utf-8')
+    n = len(data)
+    mask = (_PIC_ID_MAGIC * (n // len(_PIC_ID_MAGIC) + 1))[:n]
+    xored = (int.from_bytes(data, 'big') ^ int.from_bytes(mask, 'big')).to_bytes(n, 'big')
+    md5_bytes = md5(xored).digest()
+    # URL 安全的 base64 本身就把 '/' 换成 '_'、'+' 换成 '-'
+    return base64.urlsafe_b64encode(md5_bytes).decode('ascii')
+
 
 class QualityLevel(Enum):
     """音质等级枚举"""
@@ -133,20 +281,56 @@ class APIConstants:
     QR_LOGIN_CHECK = 'https://music.163.com/login?csrf_token='
 
     
-    # 默认配置
-    DEFAULT_CONFIG = {
+    # 默认配置（只读：各处只会基于它构造新字典，不允许原地修改）
+    DEFAULT_CONFIG = MappingProxyType({
         "os": "pc",
         "appver": "",
         "osver": "",
         "deviceId": "pyncm!"
-    }
+    })
     
-    DEFAULT_COOKIES = {
+    DEFAULT_COOKIES = MappingProxyType({
         "os": "pc",
         "appver": "",
         "osver": "",
         "deviceId": "pyncm!"
-    }
+    })
+
+
+# eapi 请求体里的 header 字段 = DEFAULT_CONFIG + requestId 的 JSON。结构固定、只有 requestId 每次不同：
+# 启动时按 json.dumps 的默认格式生成到 requestId 值之前的前缀，每次请求只需拼接，不再 copy 字典 + dumps
+_EAPI_HEADER_PREFIX = json.dumps({**APIConstants.DEFAULT_CONFIG, "requestId": ""})[:-2]
+
+
+# requestId 只需落在 [20000000, 30000000) 且不重复即可：起点随机取一次，之后用计数器递增（next() 在 C 里完成，
+# 多线程下也不会重号），不必每个请求都走一遍随机数生成器
+_REQUEST_ID_BASE = 20000000
+_REQUEST_ID_SPAN = 10000000
+_REQUEST_ID_COUNTER = count(randrange(_REQUEST_ID_SPAN))
+
+
+def _eapi_header() -> str:
+    """生成一次 eapi 请求的 header JSON 字符串（与 json.dumps({**DEFAULT_CONFIG, 'requestId': rid}) 相同）"""
+    request_id = _REQUEST_ID_BASE + next(_REQUEST_ID_COUNTER) % _REQUEST_ID_SPAN
+    return f'{_EAPI_HEADER_PREFIX}{request_id}"}}'
+
+
+# UA / Referer 对所有网易云接口都一样：设成 Session 默认头，各请求不必再各自构造 headers 字典
+SESSION.headers.update({
+    'User-Agent': APIConstants.USER_AGENT,
+    'Referer': APIConstants.REFERER,
+})
+
+
+@lru_cache(maxsize=64)
+def _eapi_path(url: str) -> str:
+    """eapi 接口 URL → 参与签名的路径（/eapi/ 换成 /api/）。接口地址是固定的几个常量，解析一次即可"""
+    return urllib.parse.urlparse(url).path.replace("/eapi/", "/api/")
+
+
+# eapi 用固定密钥的 AES-ECB：Cipher（含算法与密钥校验）启动时建一次，ECB 无 IV/状态，复用安全
+_AES_ECB_CIPHER = Cipher(algorithms.AES(APIConstants.AES_KEY), modes.ECB())
+_AES_BLOCK_SIZE = algorithms.AES.block_size
 
 
 class CryptoUtils:
@@ -154,8 +338,8 @@ class CryptoUtils:
     
     @staticmethod
     def hex_digest(data: bytes) -> str:
-        """将字节数据转换为十六进制字符串"""
-        return "".join([hex(d)[2:].zfill(2) for d in data])
+        """将字节数据转换为十六进制字符串（小写，与逐字节 hex+zfill 结果一致）"""
+        return data.hex()
     
     @staticmethod
     def hash_digest(text: str) -> bytes:
@@ -170,15 +354,22 @@ class CryptoUtils:
     @staticmethod
     def encrypt_params(url: str, payload: Dict[str, Any]) -> str:
         """加密请求参数"""
-        url_path = urllib.parse.urlparse(url).path.replace("/eapi/", "/api/")
-        digest = CryptoUtils.hash_hex_digest(f"nobody{url_path}use{json.dumps(payload)}md5forencrypt")
-        params = f"{url_path}-36cd479b6b5-{json.dumps(payload)}-36cd479b6b5-{digest}"
+        url_path = _eapi_path(url)
+        # 摘要与明文里嵌入的是同一份 payload JSON，只序列化一次
+        payload_json = json.dumps(payload)
+        # 分段喂给 md5，省去拼接中间字符串；结果与整串 "nobody{path}use{json}md5forencrypt" 的摘要相同
+        hasher = md5(b"nobody")
+        hasher.update(url_path.encode("utf-8"))
+        hasher.update(b"use")
+        hasher.update(payload_json.encode("utf-8"))
+        hasher.update(b"md5forencrypt")
+        digest = hasher.hexdigest()
+        params = f"{url_path}-36cd479b6b5-{payload_json}-36cd479b6b5-{digest}"
         
-        # AES加密
-        padder = padding.PKCS7(algorithms.AES(APIConstants.AES_KEY).block_size).padder()
+        # AES加密（Cipher 复用模块级实例，每次只新建轻量的 padder/encryptor 上下文）
+        padder = padding.PKCS7(_AES_BLOCK_SIZE).padder()
         padded_data = padder.update(params.encode()) + padder.finalize()
-        cipher = Cipher(algorithms.AES(APIConstants.AES_KEY), modes.ECB())
-        encryptor = cipher.encryptor()
+        encryptor = _AES_ECB_CIPHER.encryptor()
         enc = encryptor.update(padded_data) + encryptor.finalize()
         
         return CryptoUtils.hex_digest(enc)
@@ -186,30 +377,38 @@ class CryptoUtils:
 
 class HTTPClient:
     """HTTP客户端类"""
+
+    # 最近一次合并结果：(调用方传入的 cookies 对象, 合并 DEFAULT_COOKIES 后的字典)。
+    # CookieManager 每次更新 cookie 都会换一个新字典，同一份 cookies 会被反复传入（如歌单分批请求），
+    # 按对象身份命中即可复用，不必每次 copy + update；这里持有原对象引用，不会出现 id 复用误命中。
+    _merged_cookies: Tuple[Optional[Dict[str, str]], Dict[str, str]] = (None, {})
+
+    @staticmethod
+    def _request_cookies(cookies: Dict[str, str]) -> Dict[str, str]:
+        """DEFAULT_COOKIES 与用户 cookies 合并后的请求 cookie（用户值优先）"""
+        source, merged = HTTPClient._merged_cookies
+        if source is not cookies:
+            merged = {**APIConstants.DEFAULT_COOKIES, **cookies}
+            HTTPClient._merged_cookies = (cookies, merged)
+        return merged
     
     @staticmethod
     def post_request_full(url: str, params: str, cookies: Dict[str, str]) -> requests.Response:
         """发送POST请求并返回完整响应对象"""
-        headers = {
-            'User-Agent': APIConstants.USER_AGENT,
-            'Referer': APIConstants.REFERER,
-        }
-
-        request_cookies = APIConstants.DEFAULT_COOKIES.copy()
-        request_cookies.update(cookies)
+        request_cookies = HTTPClient._request_cookies(cookies)
 
         try:
-            response = SESSION.post(url, headers=headers, cookies=request_cookies,
-                                   data={"params": params}, timeout=30)
+            response = SESSION.post(url, cookies=request_cookies,
+                                   data={"params": params}, timeout=_HTTP_TIMEOUT)
             response.raise_for_status()
             return response
         except requests.RequestException as e:
             raise APIException(f"HTTP请求失败: {e}")
 
     @staticmethod
-    def post_request(url: str, params: str, cookies: Dict[str, str]) -> str:
-        """发送POST请求并返回文本响应"""
-        return HTTPClient.post_request_full(url, params, cookies).text
+    def post_request(url: str, params: str, cookies: Dict[str, str]) -> bytes:
+        """发送POST请求并返回原始响应体（bytes，可直接交给 JSON 解析，省一次整包 UTF-8 解码）"""
+        return HTTPClient.post_request_full(url, params, cookies).content
 
 
 class APIException(Exception):
@@ -217,6 +416,26 @@ class APIException(Exception):
     pass
 
 
+# 解析阶段要转换成 APIException 的异常：默认含 KeyError（响应缺字段），只取整包结果的接口仅需 JSON 解析错误
+_PARSE_ERRORS = (json.JSONDecodeError, KeyError)
+_PARSE_ERRORS_JSON = (json.JSONDecodeError,)
+
+
+def _api_guard(label: str, parse_errors: Tuple[type, ...] = _PARSE_ERRORS):
+    """把接口方法里的请求/解析异常统一转换为 APIException（消息格式：获取{label}请求失败 / 解析{label}响应失败）"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except requests.RequestException as e:
+                raise APIException(f"获取{label}请求失败: {e}")
+            except parse_errors as e:
+                raise APIException(f"解析{label}响应失败: {e}")
+        return wrapper
+    return decorator
+
+
 class NeteaseAPI:
     """网易云音乐API主类"""
     
@@ -238,31 +457,38 @@ class NeteaseAPI:
         Raises:
             APIException: API调用失败时抛出
         """
+        cache_key = (str(song_id), quality, cookies.get('MUSIC_U', ''))
+        cached = _SONG_URL_CACHE.get(cache_key)
+        if cached is not _TTLCache._MISSING:
+            return cached
+
         try:
-            config = APIConstants.DEFAULT_CONFIG.copy()
-            config["requestId"] = str(randrange(20000000, 30000000))
-            
             payload = {
                 'ids': [song_id],
                 'level': quality,
                 'encodeType': 'flac',
-                'header': json.dumps(config),
+                'header': _eapi_header(),
             }
             
             if quality == 'sky':
                 payload['immerseType'] = 'c51'
             
             params = self.crypto_utils.encrypt_params(APIConstants.SONG_URL_V1, payload)
-            response_text = self.http_client.post_request(APIConstants.SONG_URL_V1, params, cookies)
+            response_body = self.http_client.post_request(APIConstants.SONG_URL_V1, params, cookies)
             
-            result = json.loads(response_text)
+            result = _loads(response_body)
             if result.get('code') != 200:
                 raise APIException(f"获取歌曲URL失败: {result.get('message', '未知错误')}")
             
+            # 无版权/该音质不可用时网易云同样回 code 200，只是 url 为空：这种结果不缓存，下次照常重新获取
+            data = result.get('data') or [{}]
+            if data[0].get('url'):
+                _SONG_URL_CACHE.set(cache_key, result)
             return result
         except (json.JSONDecodeError, KeyError) as e:
             raise APIException(f"解析响应数据失败: {e}")
     
+    @_api_guard("歌曲详情", _PARSE_ERRORS_JSON)
     def get_song_detail(self, song_id: int) -> Dict[str, Any]:
         """获取歌曲详细信息
         
@@ -275,21 +501,23 @@ class NeteaseAPI:
         Raises:
             APIException: API调用失败时抛出
         """
-        try:
-            data = {'c': json.dumps([{"id": song_id, "v": 0}])}
-            response = SESSION.post(APIConstants.SONG_DETAIL_V3, data=data, timeout=30)
-            response.raise_for_status()
-            
-            result = response.json()
-            if result.get('code') != 200:
-                raise APIException(f"获取歌曲详情失败: {result.get('message', '未知错误')}")
-            
-            return result
-        except requests.RequestException as e:
-            raise APIException(f"获取歌曲详情请求失败: {e}")
-        except json.JSONDecodeError as e:
-            raise APIException(f"解析歌曲详情响应失败: {e}")
+        cache_key = str(song_id)
+        cached = _SONG_DETAIL_CACHE.get(cache_key)
+        if cached is not _TTLCache._MISSING:
+            return cached
+
+        data = {'c': json.dumps([{"id": song_id, "v": 0}])}
+        response = SESSION.post(APIConstants.SONG_DETAIL_V3, data=data, timeout=_HTTP_TIMEOUT)
+        response.raise_for_status()
+        
+        result = _loads(response.content)
+        if result.get('code') != 200:
+            raise APIException(f"获取歌曲详情失败: {result.get('message', '未知错误')}")
+        
+        _SONG_DETAIL_CACHE.set(cache_key, result)
+        return result
     
+    @_api_guard("歌词", _PARSE_ERRORS_JSON)
     def get_lyric(self, song_id: int, cookies: Dict[str, str]) -> Dict[str, Any]:
         """获取歌词信息
         
@@ -303,38 +531,35 @@ class NeteaseAPI:
         Raises:
             APIException: API调用失败时抛出
         """
-        try:
-            data = {
-                'id': song_id, 
-                'cp': 'false', 
-                'tv': '0', 
-                'lv': '0', 
-                'rv': '0', 
-                'kv': '0', 
-                'yv': '0', 
-                'ytv': '0', 
-                'yrv': '0'
-            }
-            
-            headers = {
-                'User-Agent': APIConstants.USER_AGENT,
-                'Referer': APIConstants.REFERER
-            }
-            
-            response = SESSION.post(APIConstants.LYRIC_API, data=data, 
-                                   headers=headers, cookies=cookies, timeout=30)
-            response.raise_for_status()
-            
-            result = response.json()
-            if result.get('code') != 200:
-                raise APIException(f"获取歌词失败: {result.get('message', '未知错误')}")
-            
-            return result
-        except requests.RequestException as e:
-            raise APIException(f"获取歌词请求失败: {e}")
-        except json.JSONDecodeError as e:
-            raise APIException(f"解析歌词响应失败: {e}")
+        cache_key = str(song_id)
+        cached = _LYRIC_CACHE.get(cache_key)
+        if cached is not _TTLCache._MISSING:
+            return cached
+
+        data = {
+            'id': song_id, 
+            'cp': 'false', 
+            'tv': '0', 
+            'lv': '0', 
+            'rv': '0', 
+            'kv': '0', 
+            'yv': '0', 
+            'ytv': '0', 
+            'yrv': '0'
+        }
+        
+        response = SESSION.post(APIConstants.LYRIC_API, data=data, 
+                               cookies=cookies, timeout=_HTTP_TIMEOUT)
+        response.raise_for_status()
+        
+        result = _loads(response.content)
+        if result.get('code') != 200:
+            raise APIException(f"获取歌词失败: {result.get('message', '未知错误')}")
+        
+        _LYRIC_CACHE.set(cache_key, result)
+        return result
     
+    @_api_guard("歌单详情")
     def get_playlist_detail(self, playlist_id: int, cookies: Dict[str, str]) -> Dict[str, Any]:
         """获取歌单详情
         
@@ -348,63 +573,87 @@ class NeteaseAPI:
         Raises:
             APIException: API调用失败时抛出
         """
-        try:
-            data = {'id': playlist_id}
-            headers = {
-                'User-Agent': APIConstants.USER_AGENT,
-                'Referer': APIConstants.REFERER
-            }
-            
-            response = SESSION.post(APIConstants.PLAYLIST_DETAIL_API, data=data, 
-                                   headers=headers, cookies=cookies, timeout=30)
-            response.raise_for_status()
-            
-            result = response.json()
-            if result.get('code') != 200:
-                raise APIException(f"获取歌单详情失败: {result.get('message', '未知错误')}")
-            
-            playlist = result.get('playlist', {})
-            # 网易云API的album.publishTime为13位毫秒级时间戳
-            create_timestamp = playlist.get('createTime')
-            # 转换为年月日格式（调用工具函数）
-            create_time = self._timestamp_str_to_date(create_timestamp)
-            info = {
-                'id': playlist.get('id'),
-                'name': playlist.get('name'),
-                'createTime' : create_time,
-                'coverImgUrl': playlist.get('coverImgUrl'),
-                'creator': playlist.get('creator', {}).get('nickname', ''),
-                'trackCount': playlist.get('trackCount'),
-                'description': playlist.get('description', ''),
-                'tracks': []
-            }
-            
-            # 获取所有trackIds并分批获取详细信息
-            track_ids = [str(t['id']) for t in playlist.get('trackIds', [])]
-            for i in range(0, len(track_ids), 100):
-                batch_ids = track_ids[i:i+100]
-                song_data = {'c': json.dumps([{'id': int(sid), 'v': 0} for sid in batch_ids])}
-                
-                song_resp = SESSION.post(APIConstants.SONG_DETAIL_V3, data=song_data, 
-                                        headers=headers, cookies=cookies, timeout=30)
-                song_resp.raise_for_status()
-                
-                song_result = song_resp.json()
-                for song in song_result.get('songs', []):
-                    info['tracks'].append({
-                        'id': song['id'],
-                        'name': song['name'],
-                        'artists': '/'.join(artist['name'] for artist in song['ar']),
-                        'album': song['al']['name'],
-                        'picUrl': song['al']['picUrl']
-                    })
-            
-            return info
-        except requests.RequestException as e:
-            raise APIException(f"获取歌单详情请求失败: {e}")
-        except (json.JSONDecodeError, KeyError) as e:
-            raise APIException(f"解析歌单详情响应失败: {e}")
+        data = {'id': playlist_id}
+        
+        response = SESSION.post(APIConstants.PLAYLIST_DETAIL_API, data=data, 
+                               cookies=cookies, timeout=_HTTP_TIMEOUT)
+        response.raise_for_status()
+        
+        result = _loads(response.content)
+        if result.get('code') != 200:
+            raise APIException(f"获取歌单详情失败: {result.get('message', '未知错误')}")
+        
+        playlist = result.get('playlist', {})
+        # 网易云API的album.publishTime为13位毫秒级时间戳
+        create_timestamp = playlist.get('createTime')
+        # 转换为年月日格式（调用工具函数）
+        create_time = self._timestamp_str_to_date(create_timestamp)
+        info = {
+            'id': playlist.get('id'),
+            'name': playlist.get('name'),
+            'createTime' : create_time,
+            'coverImgUrl': playlist.get('coverImgUrl'),
+            'creator': playlist.get('creator', {}).get('nickname', ''),
+            'trackCount': playlist.get('trackCount'),
+            'description': playlist.get('description', ''),
+            'tracks': []
+        }
+        
+        # 获取所有trackIds并分批获取详细信息
+        track_ids = [str(t['id']) for t in playlist.get('trackIds', [])]
+        batches = [track_ids[i:i + _PLAYLIST_BATCH_SIZE]
+                   for i in range(0, len(track_ids), _PLAYLIST_BATCH_SIZE)]
+        # 歌单可能有上千首：用列表推导式整批构造，并把 join / tracks 绑到局部变量，省去逐首的属性查找与 append
+        join_artists = '/'.join
+        tracks = info['tracks']
+        for song_result in self._iter_song_batches(batches, cookies):
+            tracks.extend([{
+                'id': song['id'],
+                'name': song['name'],
+                'artists': join_artists(map(_ARTIST_NAME, song['ar'])),
+                'album': song['al']['name'],
+                'picUrl': song['al']['picUrl']
+            } for song in song_result.get('songs', [])])
+        
+        return info
     
+    def _iter_song_batches(self, batches: List[List[str]], cookies: Dict[str, str]):
+        """在共享 I/O 线程池里并发获取各批歌曲详情，按批次顺序逐个产出（曲目顺序不变）。
+
+        同时在途的批次不超过 _PLAYLIST_BATCH_CONCURRENCY：上千首的歌单不会一次占满线程池，
+        其他请求的单曲解析仍能排上；对网易云的并发也有上限，少触发限流。
+        任一批失败即取消尚未开始的批次并抛出，不返回缺曲目的歌单。
+        """
+        pending = deque()
+        batch_iter = iter(batches)
+        try:
+            for batch in batch_iter:
+                pending.append(IO_EXECUTOR.submit(self._fetch_song_batch, batch, cookies))
+                if len(pending) >= _PLAYLIST_BATCH_CONCURRENCY:
+                    break
+            while pending:
+                song_result = pending.popleft().result()
+                next_batch = next(batch_iter, None)
+                if next_batch is not None:
+                    pending.append(IO_EXECUTOR.submit(self._fetch_song_batch, next_batch, cookies))
+                yield song_result
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _fetch_song_batch(self, batch_ids: List[str], cookies: Dict[str, str]) -> Dict[str, Any]:
+        """批量获取一批（至多 _PLAYLIST_BATCH_SIZE 首）歌曲详情，供歌单详情并发调用"""
+        song_data = {'c': json.dumps([{'id': int(sid), 'v': 0} for sid in batch_ids])}
+
+        song_resp = SESSION.post(APIConstants.SONG_DETAIL_V3, data=song_data,
+                                 cookies=cookies, timeout=_HTTP_TIMEOUT)
+        song_resp.raise_for_status()
+        result = _loads(song_resp.content)
+        if result.get('code') != 200:
+            raise APIException(f"获取歌单曲目详情失败: {result.get('message', '未知错误')}")
+        return result
+
+    @_api_guard("专辑详情")
     def get_album_detail(self, album_id: int, cookies: Dict[str, str]) -> Dict[str, Any]:
         """获取专辑详情
         
@@ -418,45 +667,41 @@ class NeteaseAPI:
         Raises:
             APIException: API调用失败时抛出
         """
-        try:
-            url = f'{APIConstants.ALBUM_DETAIL_API}{album_id}'
-            headers = {
-                'User-Agent': APIConstants.USER_AGENT,
-                'Referer': APIConstants.REFERER
-            }
-            
-            response = SESSION.get(url, headers=headers, cookies=cookies, timeout=30)
-            response.raise_for_status()
-            
-            result = response.json()
-            if result.get('code') != 200:
-                raise APIException(f"获取专辑详情失败: {result.get('message', '未知错误')}")
-            
-            album = result.get('album', {})
-            info = {
-                'id': album.get('id'),
-                'name': album.get('name'),
-                'coverImgUrl': self.get_pic_url(album.get('pic')),
-                'artist': album.get('artist', {}).get('name', ''),
-                'publishTime': album.get('publishTime'),
-                'description': album.get('description', ''),
-                'songs': []
-            }
-            
-            for song in result.get('songs', []):
-                info['songs'].append({
-                    'id': song['id'],
-                    'name': song['name'],
-                    'artists': '/'.join(artist['name'] for artist in song['ar']),
-                    'album': song['al']['name'],
-                    'picUrl': self.get_pic_url(song['al'].get('pic'))
-                })
-            
-            return info
-        except requests.RequestException as e:
-            raise APIException(f"获取专辑详情请求失败: {e}")
-        except (json.JSONDecodeError, KeyError) as e:
-            raise APIException(f"解析专辑详情响应失败: {e}")
+        cache_key = str(album_id)
+        cached = _ALBUM_DETAIL_CACHE.get(cache_key)
+        if cached is not _TTLCache._MISSING:
+            return cached
+
+        url = f'{APIConstants.ALBUM_DETAIL_API}{album_id}'
+        response = SESSION.get(url, cookies=cookies, timeout=_HTTP_TIMEOUT)
+        response.raise_for_status()
+        
+        result = _loads(response.content)
+        if result.get('code') != 200:
+            raise APIException(f"获取专辑详情失败: {result.get('message', '未知错误')}")
+        
+        album = result.get('album', {})
+        info = {
+            'id': album.get('id'),
+            'name': album.get('name'),
+            'coverImgUrl': self.get_pic_url(album.get('pic')),
+            'artist': album.get('artist', {}).get('name', ''),
+            'publishTime': album.get('publishTime'),
+            'description': album.get('description', ''),
+        }
+        
+        join_artists = '/'.join
+        get_pic_url = self.get_pic_url
+        info['songs'] = [{
+            'id': song['id'],
+            'name': song['name'],
+            'artists': join_artists(map(_ARTIST_NAME, song['ar'])),
+            'album': song['al']['name'],
+            'picUrl': get_pic_url(song['al'].get('pic'))
+        } for song in result.get('songs', [])]
+        
+        _ALBUM_DETAIL_CACHE.set(cache_key, info)
+        return info
     
     def netease_encrypt_id(self, id_str: str) -> str:
         """网易云加密图片ID算法
@@ -467,21 +712,7 @@ class NeteaseAPI:
         Returns:
             加密后的字符串
         """
-        import base64
-        import hashlib
-        
-        magic = list('3go8&$8*3*3h0k(2)2')
-        song_id = list(id_str)
-        
-        for i in range(len(song_id)):
-            song_id[i] = chr(ord(song_id[i]) ^ ord(magic[i % len(magic)]))
-        
-        m = ''.join(song_id)
-        md5_bytes = hashlib.md5(m.encode('utf-8')).digest()
-        result = base64.b64encode(md5_bytes).decode('utf-8')
-        result = result.replace('/', '_').replace('+', '-')
-        
-        return result
+        return _encrypt_pic_id(id_str)
     
     def is_cookie_valid(self, cookies: Dict[str, str]) -> Dict[str, bool]:
         """检查Cookie是否有效并判断是否为VIP
@@ -495,22 +726,15 @@ class NeteaseAPI:
             if not cookies:
                 return {'valid': False, 'is_vip': False}
             
-            # 调用用户账号信息接口验证登录状态
-            headers = {
-                'User-Agent': APIConstants.USER_AGENT,
-                'Referer': APIConstants.REFERER
-            }
-            
-            # 发送请求（该接口无需复杂参数，仅需登录态Cookie）
+            # 调用用户账号信息接口验证登录状态（该接口无需复杂参数，仅需登录态Cookie）
             response = SESSION.post(
                 APIConstants.USER_ACCOUNT_API,
-                headers=headers,
                 cookies=cookies,
-                timeout=30
+                timeout=_HTTP_TIMEOUT
             )
             response.raise_for_status()  # 抛出HTTP错误（如403、500等）
             
-            result = response.json()
+            result = _loads(response.content)
             
             # 验证响应：code=200且包含用户信息（profile字段）则视为有效
             if result.get('code') == 200 and result.get('profile') is not None:
@@ -560,8 +784,8 @@ class NeteaseAPI:
         if pic_id is None:
             return ''
         
-        enc_id = self.netease_encrypt_id(str(pic_id))
-        return f'https://p3.music.126.net/{enc_id}/{pic_id}.jpg?param={size}y{size}'
+        enc_id = _encrypt_pic_id(str(pic_id))
+        return _PIC_URL_TEMPLATE % (enc_id, pic_id, size, size)
 
     def _timestamp_str_to_date(self, timestamp_int: int) -> str:
         """
@@ -574,14 +798,11 @@ class NeteaseAPI:
             格式化后的日期字符串，转换失败返回空字符串
         """
         try:
-            # 1. 按位数判断单位（优先逻辑，避免数值误判）
-            ts_str = str(timestamp_int)
-            ts_len = len(ts_str)
-            
-            if ts_len == 10:
+            # 1. 按位数判断单位（用数值区间代替 str() + len()，避免每次构造字符串）
+            if _TS_SECONDS_MIN <= timestamp_int < _TS_MILLIS_MIN:
                 # 10位：秒级 → 转为毫秒级
                 timestamp_ms = timestamp_int * 1000
-            elif 11 <= ts_len <= 13:
+            elif _TS_MILLIS_MIN <= timestamp_int < _TS_MILLIS_END:
                 # 11-13位：毫秒级 → 直接使用
                 timestamp_ms = timestamp_int
             else:
@@ -589,18 +810,64 @@ class NeteaseAPI:
                 return ""
             
             # 2. 验证时间范围（1970-01-01 ~ 2100-12-31，毫秒级）
-            min_ts = 0  # 1970-01-01 00:00:00（毫秒级）
-            max_ts = 4102444799000  # 2100-12-31 23:59:59（毫秒级）
-            if not (min_ts <= timestamp_ms <= max_ts):
+            if timestamp_ms > _TS_MAX_MS:
                 return ""
             
-            # 3. 转换为日期（毫秒级→秒级，除以1000）
-            return datetime.fromtimestamp(timestamp_ms / 1000).strftime("%Y-%m-%d")
+            # 3. 转换为日期（同一专辑/歌单的曲目时间戳相同，命中缓存即可跳过 datetime 构造）
+            return _format_timestamp_ms(timestamp_ms)
         
         except (ValueError, TypeError, OSError):
             return ""
 
 
+def _extract_music_u(response: requests.Response) -> Dict[str, str]:
+    """从登录成功响应里取 MUSIC_U，返回 {'MUSIC_U': 值}（没有则为空字典）。
+
+    直接遍历 requests 已解析好的 cookie jar：不必手工拆 Set-Cookie 头，
+    也不会被 Expires=Wed, 01 Jan ... 里的逗号切错。网易云可能为多个域各下发一条 MUSIC_U，
+    jar.get() 遇到同名会抛 CookieConflictError，因此逐条取，与原逻辑一样以最后一条为准。
+    """
+    music_u = None
+    for cookie in response.cookies:
+        if cookie.name == 'MUSIC_U' and cookie.value:
+            music_u = cookie.value
+    return {'MUSIC_U': music_u} if music_u else {}
+
+
+@lru_cache(maxsize=32)
+def _qr_check_params(unikey: str) -> str:
+    """同一个二维码 key 的状态轮询请求体是固定的：加密一次，整个扫码会话内复用
+
+    requestId 随之在该会话内固定，服务端轮询接口并不依赖它区分请求。
+    """
+    payload = {
+        'key': unikey,
+        'type': 1,
+        'header': _eapi_header()
+    }
+    return CryptoUtils.encrypt_params(APIConstants.QR_LOGIN_API, payload)
+
+
+# 控制台扫码登录的轮询间隔（秒）：等待扫码时从 BASE 指数退避到 CAP，已扫码待确认时固定 CONFIRM_INTERVAL
+_QR_POLL_BASE = 1.5
+_QR_POLL_CAP = 15.0
+_QR_POLL_CONFIRM_INTERVAL = 1.0
+# 控制台扫码登录的总时限（秒）：超时即放弃，避免无人扫码或服务端失联时无限轮询
+_QR_LOGIN_DEADLINE = 300
+# 网页轮询返回给前端的状态说明
+_QR_STATUS_MESSAGES = MappingProxyType({
+    800: '二维码已过期',
+    801: '等待扫码中...',
+    802: '已扫码，请在手机上确认',
+    803: '登录成功'
+})
+# 控制台轮询中的状态行（回车覆盖同一行）
+_QR_POLL_STATUS_LINES = {
+    801: "\r等待扫码...",
+    802: "\r扫码成功，请在手机上确认登录...",
+}
+
+
 class QRLoginManager:
     """二维码登录管理器"""
     
@@ -618,18 +885,15 @@ class QRLoginManager:
             APIException: API调用失败时抛出
         """
         try:
-            config = APIConstants.DEFAULT_CONFIG.copy()
-            config["requestId"] = str(randrange(20000000, 30000000))
-            
             payload = {
                 'type': 1,
-                'header': json.dumps(config)
+                'header': _eapi_header()
             }
             
             params = self.crypto_utils.encrypt_params(APIConstants.QR_UNIKEY_API, payload)
             response = self.http_client.post_request_full(APIConstants.QR_UNIKEY_API, params, {})
             
-            result = json.loads(response.text)
+            result = _loads(response.content)
             if result.get('code') == 200:
                 return result.get('unikey')
             else:
@@ -644,10 +908,11 @@ class QRLoginManager:
             字典包含success状态、qr_key、qr_base64和消息
         """
         try:
-            if not qrcode or not Image:
+            missing = [pkg for pkg, mod in (('qrcode', qrcode), ('pillow', Image)) if mod is None]
+            if missing:
                 return {
                     'success': False, 
-                    'message': '请安装qrcode和PIL库: pip install qrcode pillow'
+                    'message': f"请安装{'和'.join(missing)}库: pip install {' '.join(missing)}"
                 }
             
             # 获取unikey
@@ -669,13 +934,13 @@ class QRLoginManager:
             qr.add_data(qr_content)
             qr.make(fit=True)
             
-            # 生成图片（RGB模式，白色背景，黑色前景）
-            img = qr.make_image(fill_color="black", back_color="white").convert('RGB')
+            # 生成图片（白色背景，黑色前景）。黑白配色下 qrcode 直接产出 1 位图，
+            # 不再转成 RGB：省一次整图像素拷贝，待 PNG 编码的像素数据也只有 RGB 的 1/24
+            img = qr.make_image(fill_color="black", back_color="white")
             
-            # 将图片保存到内存字节流
+            # 将图片保存到内存字节流（getvalue 读取全部内容，无需回拨文件指针）
             img_byte_arr = BytesIO()
             img.save(img_byte_arr, format='PNG')  # 保存为PNG格式
-            img_byte_arr.seek(0)  # 重置文件指针
             
             # 转换为base64
             qr_base64 = base64.b64encode(img_byte_arr.getvalue()).decode('utf-8')
@@ -697,9 +962,11 @@ class QRLoginManager:
         Returns:
             成功返回unikey，失败返回None
         """
+        if not qrcode:
+            print("请安装qrcode库: pip install qrcode")
+            return None
+
         try:
-            import qrcode
-            
             unikey = self.generate_qr_key()
             if not unikey:
                 print("生成二维码key失败")
@@ -714,9 +981,6 @@ class QRLoginManager:
             qr.print_ascii(tty=True)
             print("\n请使用网易云音乐APP扫描上方二维码登录")
             return unikey
-        except ImportError:
-            print("请安装qrcode库: pip install qrcode")
-            return None
         except Exception as e:
             print(f"创建二维码失败: {e}")
             return None
@@ -734,51 +998,22 @@ class QRLoginManager:
             APIException: API调用失败时抛出
         """
         try:
-            config = APIConstants.DEFAULT_CONFIG.copy()
-            config["requestId"] = str(randrange(20000000, 30000000))
-            
-            payload = {
-                'key': unikey,
-                'type': 1,
-                'header': json.dumps(config)
-            }
-            
-            params = self.crypto_utils.encrypt_params(APIConstants.QR_LOGIN_API, payload)
+            params = _qr_check_params(unikey)
             response = self.http_client.post_request_full(APIConstants.QR_LOGIN_API, params, {})
             
-            result = json.loads(response.text)
-            cookie_dict = {}
-            
-            if result.get('code') == 803:
-                # 登录成功，提取cookie
-                all_cookies = response.headers.get('Set-Cookie', '').split(', ')
-                for cookie_str in all_cookies:
-                    if 'MUSIC_U=' in cookie_str:
-                        cookie_dict['MUSIC_U'] = cookie_str.split('MUSIC_U=')[1].split(';')[0]
+            result = _loads(response.content)
+            # 登录成功，提取cookie
+            cookie_dict = _extract_music_u(response) if result.get('code') == 803 else {}
             
             return result.get('code', -1), cookie_dict
         except (json.JSONDecodeError, KeyError) as e:
             raise APIException(f"解析登录状态响应失败: {e}")
     
     def check_login_status(self, qr_key: str) -> Dict[str, Any]:
-        """检查二维码登录状态"""
+        """检查二维码登录状态（网页轮询用：在 check_qr_login 之上整理成响应字典，异常转为失败结果）"""
         try:
-            config = APIConstants.DEFAULT_CONFIG.copy()
-            config["requestId"] = str(randrange(20000000, 30000000))
-            
-            payload = {
-                'key': qr_key,
-                'type': 1,
-                'header': json.dumps(config)
-            }
-            
-            params = self.crypto_utils.encrypt_params(APIConstants.QR_LOGIN_API, payload)
-            response = self.http_client.post_request_full(APIConstants.QR_LOGIN_API, params, {})
-            
-            result = json.loads(response.text)
-            cookie_dict = {}
-            
-            self.login_status = result.get('code', -1)
+            code, cookie_dict = self.check_qr_login(qr_key)
+            self.login_status = code
 
             # 状态码说明：
             # 800 - 二维码已过期
@@ -792,28 +1027,20 @@ class QRLoginManager:
                 'message': self._get_status_message(self.login_status)
             }
 
-            if result.get('code') == 803:
-                # 登录成功，提取cookie
-                all_cookies = response.headers.get('Set-Cookie', '').split(', ')
-                for cookie_str in all_cookies:
-                    if 'MUSIC_U=' in cookie_str:
-                        cookie_dict['MUSIC_U'] = cookie_str.split('MUSIC_U=')[1].split(';')[0]
-
+            if code == 803:
+                # 登录成功，返回cookie
                 res['cookie'] = cookie_dict['MUSIC_U']
             return res
            
-        except Exception as e:
+        except (APIException, KeyError) as e:
+            # 请求/解析失败（HTTPClient 已把 requests 异常、check_qr_login 已把 JSON 错误转成 APIException）
+            # 或 803 响应缺 MUSIC_U：转成失败结果交给网页路由；其余异常属于程序错误，照常抛出
             return {'success': False, 'message': f'检查登录状态时发生错误：{str(e)}'}
     
     def _get_status_message(self, status_code: int) -> str:
         """根据状态码返回对应的消息"""
-        messages = {
-            800: '二维码已过期',
-            801: '等待扫码中...',
-            802: '已扫码，请在手机上确认',
-            803: '登录成功'
-        }
-        return messages.get(status_code, f'未知状态：{status_code}')
+        message = _QR_STATUS_MESSAGES.get(status_code)
+        return message if message is not None else f'未知状态：{status_code}'
 
     def qr_login(self) -> Optional[str]:
         """完整的二维码登录流程
@@ -826,21 +1053,45 @@ class QRLoginManager:
             if not unikey:
                 return None
             
+            attempt = 0
+            last_code = None
+            deadline = time.monotonic() + _QR_LOGIN_DEADLINE
             while True:
-                code, cookies = self.check_qr_login(unikey)
+                if time.monotonic() >= deadline:
+                    print("\n登录超时，请重新获取二维码")
+                    return None
+                try:
+                    code, cookies = self.check_qr_login(unikey)
+                except APIException as e:
+                    # 网络/接口错误：同样退避重试，但上限放宽一倍，给服务端恢复时间
+                    print(f"\n检查登录状态失败，稍后重试: {e}")
+                    last_code = None  # 错误信息换了行，恢复后重新输出状态行
+                    time.sleep(uniform(0, min(_QR_POLL_CAP * 2, _QR_POLL_BASE * 2 ** attempt)))
+                    attempt += 1
+                    continue
                 
                 if code == 803:
                     print("\n登录成功！")
                     return f"MUSIC_U={cookies['MUSIC_U']};os=pc;appver=8.9.70;"
-                elif code == 801:
-                    print("\r等待扫码...", end='')
-                elif code == 802:
-                    print("\r扫码成功，请在手机上确认登录...", end='')
+                elif code in _QR_POLL_STATUS_LINES:
+                    # 状态行只在状态变化时重写，轮询期间状态不变就不再写终端
+                    if code != last_code:
+                        sys.stdout.write(_QR_POLL_STATUS_LINES[code])
+                        sys.stdout.flush()
+                        last_code = code
                 else:
                     print(f"\n登录失败，错误码：{code}")
                     return None
                 
-                time.sleep(2)
+                if code == 802:
+                    # 已扫码：确认随时会发生，固定短间隔紧跟，另外重置退避
+                    attempt = 0
+                    delay = _QR_POLL_CONFIRM_INTERVAL
+                else:
+                    # 等待扫码：指数退避 + 全抖动（随机取 [0, 上限)），长时间无人扫码时不必每 2 秒打一次接口
+                    delay = uniform(0, min(_QR_POLL_CAP, _QR_POLL_BASE * 2 ** attempt))
+                    attempt += 1
+                time.sleep(delay)
         except KeyboardInterrupt:
             print("\n用户取消登录")
             return None
@@ -850,46 +1101,72 @@ class QRLoginManager:
 
     
 
+# 向后兼容函数共用的实例：按需创建一次，之后复用，不再每次调用都新建 NeteaseAPI / QRLoginManager
+_API_SINGLETON: Optional[NeteaseAPI] = None
+_QR_MANAGER_SINGLETON: Optional[QRLoginManager] = None
+_SINGLETON_LOCK = threading.Lock()
+
+
+def _get_api() -> NeteaseAPI:
+    """获取共享的 NeteaseAPI 实例（首次调用时在锁内创建）"""
+    global _API_SINGLETON
+    if _API_SINGLETON is None:
+        with _SINGLETON_LOCK:
+            if _API_SINGLETON is None:
+                _API_SINGLETON = NeteaseAPI()
+    return _API_SINGLETON
+
+
+def _get_qr_manager() -> QRLoginManager:
+    """获取共享的 QRLoginManager 实例（首次调用时在锁内创建）"""
+    global _QR_MANAGER_SINGLETON
+    if _QR_MANAGER_SINGLETON is None:
+        with _SINGLETON_LOCK:
+            if _QR_MANAGER_SINGLETON is None:
+                _QR_MANAGER_SINGLETON = QRLoginManager()
+    return _QR_MANAGER_SINGLETON
+
+
 # 向后兼容的函数接口
 def url_v1(song_id: int, level: str, cookies: Dict[str, str]) -> Dict[str, Any]:
     """获取歌曲URL（向后兼容）"""
-    api = NeteaseAPI()
+    api = _get_api()
     return api.get_song_url(song_id, level, cookies)
 
 
 def name_v1(song_id: int) -> Dict[str, Any]:
     """获取歌曲详情（向后兼容）"""
-    api = NeteaseAPI()
+    api = _get_api()
     return api.get_song_detail(song_id)
 
 
 def lyric_v1(song_id: int, cookies: Dict[str, str]) -> Dict[str, Any]:
     """获取歌词（向后兼容）"""
-    api = NeteaseAPI()
+    api = _get_api()
     return api.get_lyric(song_id, cookies)
 
 
 def playlist_detail(playlist_id: int, cookies: Dict[str, str]) -> Dict[str, Any]:
     """获取歌单详情（向后兼容）"""
-    api = NeteaseAPI()
+    api = _get_api()
     return api.get_playlist_detail(playlist_id, cookies)
 
 
 def album_detail(album_id: int, cookies: Dict[str, str]) -> Dict[str, Any]:
     """获取专辑详情（向后兼容）"""
-    api = NeteaseAPI()
+    api = _get_api()
     return api.get_album_detail(album_id, cookies)
 
 
 def get_pic_url(pic_id: Optional[int], size: int = 300) -> str:
     """获取图片URL（向后兼容）"""
-    api = NeteaseAPI()
+    api = _get_api()
     return api.get_pic_url(pic_id, size)
 
 
 def qr_login() -> Optional[str]:
     """二维码登录（向后兼容）"""
-    manager = QRLoginManager()
+    manager = _get_qr_manager()
     return manager.qr_login()
 
 
@@ -508,44 +508,26 @@ document.addEventListener('DOMContentLoaded', async function() {
             console.log('检测到非 Safari 浏览器，使用并发下载策略...');
             
             const MAX_CONCURRENT = 3;
-            let completedCount = 0;
             let successCount = 0;
             
             const downloadQueue = [...currentSongs];
             
-            const startNextTask = async () => {
-                if (downloadQueue.length === 0) return;
-                
-                const song = downloadQueue.shift();
-                const songId = song.id || song.songId || '';
-                const songName = song.name || song.songName || '未知歌曲';
-                const songItemEl = document.querySelector(`.song-item[data-id="${songId}"]`);
-                
-                if (!songItemEl) {
-                    completedCount++;
-                    return startNextTask();
+            // 固定数量的常驻 worker 依次从队列取任务，全部取完即返回；
+            // 用 Promise.all 等所有 worker 结束，不再轮询完成计数
+            const worker = async () => {
+                while (downloadQueue.length > 0) {
+                    const song = downloadQueue.shift();
+                    const songId = song.id || song.songId || '';
+                    const songName = song.name || song.songName || '未知歌曲';
+                    const songItemEl = document.querySelector(`.song-item[data-id="${songId}"]`);
+                    if (!songItemEl) continue;
+                    
+                    const success = await clientDownloadSingleSong(songId, quality, songName, songItemEl);
+                    if (success) successCount++;
                 }
-                
-                const success = await clientDownloadSingleSong(songId, quality, songName, songItemEl);
-                
-                completedCount++;
-                if (success) successCount++;
-                
-                startNextTask();
             };
             
-            for (let i = 0; i < MAX_CONCURRENT; i++) {
-                startNextTask();
-            }
-            
-            await new Promise(resolve => {
-                const checkComplete = setInterval(() => {
-                    if (completedCount >= total) {
-                        clearInterval(checkComplete);
-                        resolve();
-                    }
-                }, 500);
-            });
+            await Promise.all(Array.from({ length: Math.min(MAX_CONCURRENT, total) }, worker));
             showToast(`批量下载完成！成功: ${successCount}/${total}`, 'success');
             
         } catch (error) {
@@ -558,44 +540,61 @@ document.addEventListener('DOMContentLoaded', async function() {
         }
     };
 
-    /**
-     * 客户端单首歌曲下载 (双模式兼容版)
-     * @param {string} songId - 歌曲ID
-     * @param {string} quality - 音质
-     * @param {string} songName - 歌曲名
-     * @param {HTMLElement} songItemEl - 歌曲DOM元素
-     * @param {HTMLElement} [downloadContainer] - (可选) Safari模式下用于存放<a>标签的容器
-     * @param {Function} [onDownloadComplete] - (可选) Safari模式下，下载确认/取消后的回调
-     * @returns {Promise<boolean|Function|null>} 
-     */
+    // 封面缓存：同一专辑的曲目共用同一个 pic_url，批量下载时只取一次。
+    // 缓存的是 Promise，并发下载同一封面时也只会发出一个请求；条目数封顶，避免长时间使用后内存无限增长。
+    const COVER_CACHE_MAX = 32;
+    const coverCache = new Map();
+
+    function fetchCover(picUrl) {
+        if (window.location.protocol === 'https:' && picUrl.startsWith('http://')) {
+            picUrl = picUrl.replace('http://', 'https://'); // 避免 https 页面混合内容被拦
+        }
+        let pending = coverCache.get(picUrl);
+        if (!pending) {
+            pending = fetch(picUrl)
+                .then(async (cr) => {
+                    if (!cr.ok) return null;
+                    return {
+                        bytes: new Uint8Array(await cr.arrayBuffer()),
+                        mime: cr.headers.get('Content-Type') || 'image/jpeg',
+                    };
+                })
+                .catch((e) => {
+                    console.warn('封面获取失败，跳过封面', e);
+                    return null;
+                });
+            // 失败的结果不缓存，下次仍可重试
+            pending.then((cover) => { if (!cover) coverCache.delete(picUrl); });
+            if (coverCache.size >= COVER_CACHE_MAX) {
+                coverCache.delete(coverCache.keys().next().value); // Map 按插入顺序，先进先出淘汰
+            }
+            coverCache.set(picUrl, pending);
+        }
+        return pending;
+    }
+
     // 给下载好的音频写入元信息（标题/艺人/专辑/年份/音轨号/歌词/封面）。
     // 字节已在浏览器内存里，写标签不额外占用服务端带宽；封面直接从网易图片 CDN 取（允许跨域）。
-    // flac/mp3 才处理，m4a 等或出错时原样返回。
-    async function tagAudioBlob(blob, info) {
+    // 直接接收拼好的 Uint8Array，不再先包成 Blob 再 arrayBuffer() 读回，省一次整文件拷贝。
+    // 仅处理 AudioTagger 支持的格式（flac/mp3），m4a 等或出错时原样返回。
+    async function tagAudioBytes(bytes, info) {
         try {
             const fmt = (info.file_type || '').toLowerCase();
-            if (!window.AudioTagger || (fmt !== 'flac' && fmt !== 'mp3')) return blob;
+            if (!window.AudioTagger || !window.AudioTagger.supports(fmt)) return bytes;
 
             let coverBytes = null, coverMime = '';
             if (info.pic_url) {
-                try {
-                    let picUrl = info.pic_url;
-                    if (window.location.protocol === 'https:' && picUrl.startsWith('http://')) {
-                        picUrl = picUrl.replace('http://', 'https://'); // 避免 https 页面混合内容被拦
-                    }
-                    const cr = await fetch(picUrl);
-                    if (cr.ok) {
-                        coverBytes = new Uint8Array(await cr.arrayBuffer());
-                        coverMime = cr.headers.get('Content-Type') || 'image/jpeg';
-                    }
-                } catch (e) { console.warn('封面获取失败，跳过封面', e); }
+                const cover = await fetchCover(info.pic_url);
+                if (cover) {
+                    coverBytes = cover.bytes;
+                    coverMime = cover.mime;
+                }
             }
 
             const artists = Array.isArray(info.artists) && info.artists.length
                 ? info.artists
                 : (info.artist_string ? [info.artist_string] : []);
-            const audioBuf = await blob.arrayBuffer();
-            const tagged = window.AudioTagger.writeTags(audioBuf, fmt, {
+            return window.AudioTagger.writeTags(bytes, fmt, {
                 title: info.name,
                 artists: artists,
                 album: info.album,
@@ -605,13 +604,22 @@ document.addEventListener('DOMContentLoaded', async function() {
                 coverBytes: coverBytes,
                 coverMime: coverMime,
             });
-            return new Blob([tagged], { type: blob.type });
         } catch (e) {
             console.warn('写入标签失败，保存原始文件', e);
-            return blob;
+            return bytes;
         }
     }
 
+    /**
+     * 客户端单首歌曲下载 (双模式兼容版)
+     * @param {string} songId - 歌曲ID
+     * @param {string} quality - 音质
+     * @param {string} songName - 歌曲名
+     * @param {HTMLElement} songItemEl - 歌曲DOM元素
+     * @param {HTMLElement} [downloadContainer] - (可选) Safari模式下用于存放<a>标签的容器
+     * @param {Function} [onDownloadComplete] - (可选) Safari模式下，下载确认/取消后的回调
+     * @returns {Promise<boolean|Function|null>} 
+     */
     async function clientDownloadSingleSong(songId, quality, songName, songItemEl, downloadContainer, onDownloadComplete) {
         const progressContainer = songItemEl.querySelector('.song-progress');
         progressContainer.style.display = 'block';
@@ -639,6 +647,11 @@ document.addEventListener('DOMContentLoaded', async function() {
             }
 
             statusContainer.innerHTML = '<span class="badge badge-downloading">下载中</span>';
+
+            // 封面与音频并行拉取：写标签时 fetchCover 会命中这里已发出的请求，不再串行等一次 CDN 往返
+            if (detailData.data.pic_url && window.AudioTagger && window.AudioTagger.supports(detailData.data.file_type)) {
+                fetchCover(detailData.data.pic_url);
+            }
             
             const response = await fetch(downloadUrl);
             if (!response.ok) throw new Error(`下载文件失败: ${response.status}`);
@@ -646,21 +659,47 @@ document.addEventListener('DOMContentLoaded', async function() {
             const contentLength = parseInt(response.headers.get('Content-Length'), 10);
             const reader = response.body.getReader();
             let receivedLength = 0;
-            const chunks = [];
+            // 已知 Content-Length 时直接按总长预分配，分块边收边写入，省去分块数组与末尾的整文件拼接拷贝；
+            // 长度未知或实际超出（如被压缩传输）时退回分块收集
+            let audioBytes = contentLength > 0 ? new Uint8Array(contentLength) : null;
+            let chunks = audioBytes ? null : [];
             
             while (true) {
                 const { done, value } = await reader.read();
                 if (done) break;
-                chunks.push(value);
+                if (audioBytes && receivedLength + value.length > audioBytes.length) {
+                    chunks = [audioBytes.subarray(0, receivedLength)];
+                    audioBytes = null;
+                }
+                if (audioBytes) {
+                    audioBytes.set(value, receivedLength);
+                } else {
+                    chunks.push(value);
+                }
                 receivedLength += value.length;
-                const progress = Math.floor((receivedLength / contentLength) * 100);
-                progressBar.style.width = `${progress}%`;
+                if (contentLength > 0) {
+                    const progress = Math.min(100, Math.floor((receivedLength / contentLength) * 100));
+                    progressBar.style.width = `${progress}%`;
+                }
             }
 
-            let blob = new Blob(chunks, { type: response.headers.get('Content-Type') });
+            if (audioBytes) {
+                // 实际长度不足时截到已收部分（subarray 不拷贝）
+                if (receivedLength < audioBytes.length) audioBytes = audioBytes.subarray(0, receivedLength);
+            } else {
+                // 分块一次性拼成连续字节，直接交给标签注入器，最后只生成一次 Blob
+                audioBytes = new Uint8Array(receivedLength);
+                let offset = 0;
+                for (const chunk of chunks) {
+                    audioBytes.set(chunk, offset);
+                    offset += chunk.length;
+                }
+                chunks = null; // 尽早释放分块引用
+            }
 
             // 保存前写入元信息（flac/mp3；m4a 原样）
-            blob = await tagAudioBlob(blob, detailData.data);
+            audioBytes = await tagAudioBytes(audioBytes, detailData.data);
+            const blob = new Blob([audioBytes], { type: response.headers.get('Content-Type') });
 
             const url = URL.createObjectURL(blob);
             const a = document.createElement('a');
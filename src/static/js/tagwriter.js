@@ -152,15 +152,21 @@
     }
 
     // ==================== 入口 ====================
+    // 格式 → 写入器。新增格式只需在这里登记，调用方通过 supports() 判断，不必各自重复 if/else
+    const WRITERS = { flac: writeFlac, mp3: writeMp3 };
+
+    function supports(fileType) {
+        return Object.prototype.hasOwnProperty.call(WRITERS, (fileType || '').toLowerCase());
+    }
+
     // arrayBuffer: 原始音频（ArrayBuffer 或 Uint8Array）；fileType: 'flac'/'mp3'/...；meta: 见 buildVorbisComment
     // 返回：写好标签的 Uint8Array（不支持的格式或出错时原样返回）
     function writeTags(arrayBuffer, fileType, meta) {
         const bytes = arrayBuffer instanceof Uint8Array ? arrayBuffer : new Uint8Array(arrayBuffer);
         try {
             const fmt = (fileType || '').toLowerCase();
-            if (fmt === 'flac') return writeFlac(bytes, meta || {});
-            if (fmt === 'mp3') return writeMp3(bytes, meta || {});
-            return bytes; // m4a 等：原样返回
+            if (!supports(fmt)) return bytes; // m4a 等：原样返回
+            return WRITERS[fmt](bytes, meta || {});
         } catch (e) {
             console.warn('[AudioTagger] 写入标签失败，返回原始音频', e);
             return bytes;
@@ -168,6 +174,6 @@
     }
 
     // 浏览器挂到 window；node 测试时挂到 module.exports
-    if (typeof window !== 'undefined') window.AudioTagger = { writeTags };
-    if (typeof module !== 'undefined' && module.exports) module.exports = { writeTags };
+    if (typeof window !== 'undefined') window.AudioTagger = { writeTags, supports };
+    if (typeof module !== 'undefined' && module.exports) module.exports = { writeTags, supports };
 })();
@@ -0,0 +1,60 @@
+"""music_api.shutdown_io_executor：服务器退出后应丢弃 I/O 线程池里排队的任务。"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import music_api  # noqa: E402
+
+
+class ShutdownIOExecutorTest(unittest.TestCase):
+    def test_queued_futures_are_cancelled(self):
+        executor = ThreadPoolExecutor(max_workers=1)
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocker():
+            started.set()
+            release.wait(5)
+            return "done"
+
+        running = executor.submit(blocker)
+        self.assertTrue(started.wait(5))
+        queued = [executor.submit(time.sleep, 1) for _ in range(4)]
+
+        with mock.patch.object(music_api, "IO_EXECUTOR", executor):
+            music_api.shutdown_io_executor()
+
+        self.assertTrue(all(f.cancelled() for f in queued))
+        # 正在执行的任务不受影响，照常完成
+        release.set()
+        self.assertEqual(running.result(timeout=5), "done")
+
+    def test_process_exit_does_not_wait_for_queued_tasks(self):
+        # 4 个排队的 1 秒任务：不取消时解释器收尾会等约 4 秒
+        script = (
+            "import time\n"
+            "from concurrent.futures import ThreadPoolExecutor\n"
+            "import music_api\n"
+            "music_api.IO_EXECUTOR = ThreadPoolExecutor(max_workers=1)\n"
+            "for _ in range(4):\n"
+            "    music_api.IO_EXECUTOR.submit(time.sleep, 1)\n"
+            "music_api.shutdown_io_executor()\n"
+        )
+        env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+        started = time.monotonic()
+        subprocess.run([sys.executable, "-c", script], check=True, env=env, timeout=30)
+        self.assertLess(time.monotonic() - started, 2.5)
+
+
+if __name__ == "__main__":
+    unittest.main()